@@ -73,8 +73,8 @@ async def check_connection() -> bool:
         raise RuntimeError("Supabase client not initialized. Check SUPABASE_URL and SUPABASE_KEY in environment.")
     try:
         # Using a lightweight query (fetch 1 header row from agent_heartbeats or similar)
-        # We use count operation which is usually cheap
-        supabase.table("agent_heartbeats").select("agent_id", count="exact").limit(1).execute()
+        # No count: an exact count makes Postgres scan the whole table just to answer a probe
+        supabase.table("agent_heartbeats").select("agent_id").limit(1).execute()
         return True
     except Exception as e:
         log_error(f"Connection probe failed: {e}", AgentType.SOUL)
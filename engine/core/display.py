@@ -12,6 +12,7 @@ Features:
 - Visual log levels with colors and emojis
 """
 
+import io
 import os
 import sys
 import time
@@ -19,7 +20,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, BinaryIO, Callable, TextIO, Union
 
 from rich.align import Align
 from rich.console import Console, Group
@@ -102,6 +103,16 @@ AGENT_INFO: Dict[AgentType, AgentInfo] = {
     ),
 }
 
+# Log level -> (style, emoji)
+LOG_LEVEL_STYLES: Dict[str, tuple] = {
+    "DEBUG": ("dim cyan", "🔍"),
+    "INFO": ("white", "ℹ️"),
+    "WARNING": ("yellow", "⚠️"),
+    "ERROR": ("red", "❌"),
+    "CRITICAL": ("bold red", "💀"),
+    "SUCCESS": ("green", "✅"),
+}
+
 
 # =============================================================================
 # DISPLAY MANAGER
@@ -122,6 +133,22 @@ class GhostDisplay:
         }
         self.current_cycle = 0
         self.is_windows = os.name == "nt"
+        # Log-line prefixes: one styled "<emoji> <NAME> " per agent, and the
+        # HH:MM:SS stamp reformatted only when the wall-clock second changes
+        self._agent_prefix: Dict[AgentType, Text] = {
+            agent: Text(f"{info.emoji} {info.name} ", style=info.color)
+            for agent, info in AGENT_INFO.items()
+        }
+        self._ts_cache = (-1, "")
+        # When set, log lines bypass Rich and are written here as plain text
+        self._plain_output: Optional[Union[TextIO, BinaryIO]] = None
+        self._plain_write: Optional[Callable[[str], Any]] = None
+        # Set by update_agent_status; update_dashboard rebuilds the agents
+        # panel only when something changed since the last rebuild
+        self._agents_dirty = False
+        # Dashboard pieces kept across start/stop cycles
+        self._dashboard_layout: Optional[Layout] = None
+        self._idle_live: Optional[Live] = None
 
     # =========================================================================
     # STARTUP BANNER
@@ -210,9 +237,27 @@ class GhostDisplay:
 
         self.console.print(table)
 
+    def reset(self) -> None:
+        """
+        Return to the just-constructed state.
+
+        Stops any live dashboard, clears the layout, sets every agent back to
+        IDLE, zeroes the cycle counter and logs through the console again.
+        The console itself is left as is.
+        """
+        self.stop_live_dashboard()
+        self.layout = None
+        self.agent_status = {agent: "IDLE" for agent in AGENT_INFO.keys()}
+        self.current_cycle = 0
+        self._plain_output = None
+        self._plain_write = None
+        self._agents_dirty = False
+
     def update_agent_status(self, agent: AgentType, status: str) -> None:
         """Update the status of a specific agent."""
-        self.agent_status[agent] = status
+        if self.agent_status.get(agent) != status:
+            self.agent_status[agent] = status
+            self._agents_dirty = True
 
     def _get_status_style(self, status: str) -> str:
         """Get Rich style based on agent status."""
@@ -433,27 +478,50 @@ class GhostDisplay:
             message: Log message
             agent: The agent generating the log
         """
-        level_styles = {
-            "DEBUG": ("dim cyan", "🔍"),
-            "INFO": ("white", "ℹ️"),
-            "WARNING": ("yellow", "⚠️"),
-            "ERROR": ("red", "❌"),
-            "CRITICAL": ("bold red", "💀"),
-            "SUCCESS": ("green", "✅"),
-        }
+        if self._plain_write is not None:
+            name = f"{AGENT_INFO[agent].name} " if agent else ""
+            self._plain_write(f"{self._log_timestamp()} {level} {name}{message}\n")
+            return
 
-        style, emoji = level_styles.get(level, ("white", "•"))
+        style, emoji = LOG_LEVEL_STYLES.get(level, ("white", "•"))
 
-        agent_prefix = ""
+        # Assemble pre-styled spans so the line is printed without a markup
+        # parse; the message is kept literal (brackets in it are not markup)
+        line = Text.assemble((self._log_timestamp(), "dim"), " ", (emoji, style), " ")
         if agent:
-            info = AGENT_INFO[agent]
-            agent_prefix = f"[{info.color}]{info.emoji} {info.name}[/] "
+            line.append_text(self._agent_prefix[agent])
+        line.append(message, style=style)
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.console.print(line)
 
-        self.console.print(
-            f"[dim]{timestamp}[/] [{style}]{emoji}[/] {agent_prefix}[{style}]{message}[/{style}]"
-        )
+    def set_plain_output(self, stream: Optional[Union[TextIO, BinaryIO]]) -> None:
+        """
+        Write log lines to a stream as plain text, skipping Rich rendering.
+
+        Meant for high-volume logging where styling is not wanted (tests,
+        piped output). Panels, tables and progress still use the console.
+        Binary streams (io.BytesIO, sys.stdout.buffer) receive UTF-8 bytes,
+        so no text layer sits between the log call and the buffer.
+
+        Args:
+            stream: Destination for "HH:MM:SS LEVEL [AGENT ]message" lines,
+                or None to log through the console again
+        """
+        self._plain_output = stream
+        if stream is None:
+            self._plain_write = None
+        elif isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            write = stream.write
+            self._plain_write = lambda line: write(line.encode("utf-8"))
+        else:
+            self._plain_write = stream.write
+
+    def _log_timestamp(self) -> str:
+        """Return the local HH:MM:SS stamp, reusing it within the same second."""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
 
     def debug(self, message: str, agent: Optional[AgentType] = None) -> None:
         """Log a debug message."""
@@ -485,22 +553,46 @@ class GhostDisplay:
 
     def start_live_dashboard(self) -> None:
         """Start a live dashboard with real-time updates."""
-        self.layout = Layout()
+        # The layout and its static panels are built once and reused across
+        # start/stop cycles; only the agents panel reflects current state
+        if self._dashboard_layout is None:
+            self._dashboard_layout = self._build_dashboard_layout()
+        self.layout = self._dashboard_layout
+
+        # Add agent status table
+        self.layout["agents"].update(self._create_agent_status_panel())
+        self._agents_dirty = False
+
+        # Start live display, reusing the stopped Live if it targets this console
+        live = self._idle_live
+        if live is None or live.console is not self.console:
+            live = Live(
+                self.layout,
+                console=self.console,
+                refresh_per_second=4,
+            )
+        self._idle_live = None
+        self.live = live
+        self.live.start()
+
+    def _build_dashboard_layout(self) -> Layout:
+        """Build the dashboard layout with its static header, activity and footer."""
+        layout = Layout()
 
         # Define layout structure
-        self.layout.split(
+        layout.split(
             Layout(name="header", size=3),
             Layout(name="main", ratio=1),
             Layout(name="footer", size=3),
         )
 
-        self.layout["main"].split_row(
+        layout["main"].split_row(
             Layout(name="agents"),
             Layout(name="activity"),
         )
 
         # Add header
-        self.layout["header"].update(
+        layout["header"].update(
             Panel(
                 Align.center(
                     Text("GHOST ENGINE v3.0 - LIVE DASHBOARD", style="bold bright_cyan")
@@ -509,11 +601,8 @@ class GhostDisplay:
             )
         )
 
-        # Add agent status table
-        self.layout["agents"].update(self._create_agent_status_panel())
-
         # Add activity feed
-        self.layout["activity"].update(
+        layout["activity"].update(
             Panel(
                 Text("Activity feed coming soon...", style="dim"),
                 title="📋 ACTIVITY",
@@ -522,7 +611,7 @@ class GhostDisplay:
         )
 
         # Add footer
-        self.layout["footer"].update(
+        layout["footer"].update(
             Panel(
                 Align.center(
                     Text("Press Ctrl+C to exit", style="dim white")
@@ -531,18 +620,19 @@ class GhostDisplay:
             )
         )
 
-        # Start live display
-        self.live = Live(
-            self.layout,
-            console=self.console,
-            refresh_per_second=4,
-        )
-        self.live.start()
+        return layout
 
     def update_dashboard(self) -> None:
-        """Update the live dashboard with current status."""
-        if self.live and self.layout:
+        """
+        Update the live dashboard with current status.
+
+        Status changes since the last call are coalesced into one rebuild of
+        the agents panel; with nothing changed this is a no-op. Live itself
+        repaints at its own refresh rate.
+        """
+        if self.live and self.layout and self._agents_dirty:
             self.layout["agents"].update(self._create_agent_status_panel())
+            self._agents_dirty = False
 
     def _create_agent_status_panel(self) -> Panel:
         """Create the agent status panel for the dashboard."""
@@ -574,6 +664,7 @@ class GhostDisplay:
         """Stop the live dashboard."""
         if self.live:
             self.live.stop()
+            self._idle_live = self.live
             self.live = None
 
     # =========================================================================
@@ -14,6 +14,7 @@ Features:
 """
 import asyncio
 import hashlib
+import time
 import traceback
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -26,6 +27,22 @@ from core.error_codes import (
 )
 
 
+# Error code -> (message, hint), built once from ErrorCodes at import
+_CODE_LOOKUP: dict[str, tuple[str, str]] = {
+    code: (msg, hint)
+    for attr_name in dir(ErrorCodes)
+    if not attr_name.startswith("_")
+    for code, msg, hint in (getattr(ErrorCodes, attr_name),)
+}
+
+
+def _format_stack_trace(exception: BaseException) -> str:
+    """Format the exception's own traceback (valid outside its except block)"""
+    return "".join(
+        traceback.format_exception(type(exception), exception, exception.__traceback__)
+    )
+
+
 @dataclass
 class ErrorEvent:
     """Structured error event for logging and broadcasting"""
@@ -71,6 +88,9 @@ class ErrorDispatcher:
     # Error deduplication window (seconds)
     DEDUPLICATION_WINDOW = 60
 
+    # Upper bound on distinct errors tracked for deduplication
+    MAX_TRACKED_ERRORS = 1024
+
     def __init__(self, agent_name: str, event_bus=None, synapse=None):
         """
         Initialize ErrorDispatcher
@@ -84,14 +104,11 @@ class ErrorDispatcher:
         self.event_bus = event_bus
         self.synapse = synapse
         self._error_hashes = set()  # For deduplication
-        self._error_timestamps = {}  # Hash -> timestamp
+        self._error_timestamps = {}  # Hash -> timestamp, oldest first
+        self._pending_tasks: set[asyncio.Task] = set()  # Background broadcasts/persists
 
-        # Lookup for error code hints
-        self._code_lookup = {}
-        for attr_name in dir(ErrorCodes):
-            if not attr_name.startswith("_"):
-                code, msg, hint = getattr(ErrorCodes, attr_name)
-                self._code_lookup[code] = (msg, hint)
+        # Lookup for error code hints (shared, read-only)
+        self._code_lookup = _CODE_LOOKUP
 
     def _get_error_info(self, code: str) -> tuple[str, str]:
         """Get error message and hint from error code"""
@@ -99,29 +116,36 @@ class ErrorDispatcher:
             return self._code_lookup[code]
         return code, "Check system logs for details"
 
-    def _generate_hash(self, code: str, message: str) -> str:
-        """Generate MD5 hash for deduplication"""
+    def _generate_hash(self, code: str, message: str) -> bytes:
+        """Generate a short BLAKE2b key for deduplication (raw digest, no hex)"""
         hash_input = f"{self.agent_name}:{code}:{message[:100]}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        return hashlib.blake2b(hash_input.encode(), digest_size=8).digest()
 
-    def _is_duplicate(self, error_hash: str) -> bool:
+    def _is_duplicate(self, error_hash: bytes) -> bool:
         """Check if error is duplicate within deduplication window"""
-        now = datetime.now().timestamp()
-
-        # Clean old hashes
-        old_hashes = [
-            h for h, ts in self._error_timestamps.items()
-            if now - ts > self.DEDUPLICATION_WINDOW
-        ]
-        for h in old_hashes:
-            del self._error_timestamps[h]
-            self._error_hashes.discard(h)
+        # Monotonic so a wall-clock step cannot reorder entries
+        now = time.monotonic()
+
+        # Clean old hashes. Entries are only ever appended with the current
+        # time, so the dict is oldest-first and the scan stops at the first
+        # live one.
+        cutoff = now - self.DEDUPLICATION_WINDOW
+        while self._error_timestamps:
+            oldest = next(iter(self._error_timestamps))
+            if self._error_timestamps[oldest] >= cutoff:
+                break
+            del self._error_timestamps[oldest]
+            self._error_hashes.discard(oldest)
 
         # Check if duplicate
         if error_hash in self._error_hashes:
             return True
 
-        # Track new error
+        # Track new error, dropping the oldest once the cap is reached
+        if len(self._error_timestamps) >= self.MAX_TRACKED_ERRORS:
+            oldest = next(iter(self._error_timestamps))
+            del self._error_timestamps[oldest]
+            self._error_hashes.discard(oldest)
         self._error_hashes.add(error_hash)
         self._error_timestamps[error_hash] = now
         return False
@@ -205,7 +229,7 @@ class ErrorDispatcher:
             agent_name=self.agent_name,
             context=context or {},
             hint=final_hint,
-            stack_trace=traceback.format_exc() if exception else None
+            stack_trace=_format_stack_trace(exception) if exception is not None else None
         )
 
         # Check for deduplication
@@ -220,7 +244,7 @@ class ErrorDispatcher:
 
         # Broadcast to frontend via EventBus (non-blocking)
         if self.event_bus:
-            asyncio.create_task(self._broadcast_error(error))
+            self._spawn(self._broadcast_error(error))
 
         # Log to Synapse if available
         if self.synapse:
@@ -229,10 +253,21 @@ class ErrorDispatcher:
                 await self._log_to_synapse(error)
             else:
                 # Non-critical: Fire-and-forget
-                asyncio.create_task(self._log_to_synapse(error))
+                self._spawn(self._log_to_synapse(error))
 
         return error
 
+    def _spawn(self, coro) -> None:
+        """Run a background coroutine, holding a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    async def wait_for_flush(self) -> None:
+        """Wait until all fire-and-forget broadcasts and Synapse writes have finished"""
+        while self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+
     async def _broadcast_error(self, error: ErrorEvent):
         """Broadcast error to frontend via EventBus"""
         try:
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
 import sys
 from pathlib import Path
@@ -50,6 +51,11 @@ class ChangeAnalysis:
     total_lines_changed: int = 0
     high_value_files: List[str] = field(default_factory=list)
 
+    @cached_property
+    def changed_files(self) -> List[str]:
+        """Paths of all changed files, computed once per analysis."""
+        return [c.file_path for c in self.changes]
+
 
 class ChangeAnalyzer:
     """Analyzes git changes and determines documentation impact."""
@@ -98,6 +98,7 @@ class EvolutionOrchestrator:
         try:
             if analysis is None:
                 analysis = self.analyzer.analyze_staged()
+            doc_targets = sorted(analysis.doc_targets)
 
             # If not significant, skip updates
             if not analysis.is_significant:
@@ -115,8 +116,8 @@ class EvolutionOrchestrator:
             record = EvolutionRecord(
                 commit_hash=temp_hash,
                 commit_message=commit_info.get('message', ''),
-                changed_files=[c.file_path for c in analysis.changes],
-                doc_targets=list(analysis.doc_targets),
+                changed_files=analysis.changed_files,
+                doc_targets=doc_targets,
                 is_significant=analysis.is_significant,
                 update_mode='sync',
                 triggers_soul=analysis.triggers_soul,
@@ -126,7 +127,7 @@ class EvolutionOrchestrator:
             record_id = self.database.log_evolution(record)
 
             # Execute updates based on doc targets
-            for target in analysis.doc_targets:
+            for target in doc_targets:
                 try:
                     self._execute_update(target, analysis, result)
                 except Exception as e:
@@ -197,6 +198,7 @@ class EvolutionOrchestrator:
 
             # Analyze the commit
             analysis = self.analyzer.analyze_commit(commit_hash)
+            doc_targets = sorted(analysis.doc_targets)
 
             # If not significant, skip
             if not analysis.is_significant:
@@ -205,8 +207,8 @@ class EvolutionOrchestrator:
                 record = EvolutionRecord(
                     commit_hash=commit_hash,
                     commit_message=commit_info.get('message', ''),
-                    changed_files=[c.file_path for c in analysis.changes],
-                    doc_targets=list(analysis.doc_targets),
+                    changed_files=analysis.changed_files,
+                    doc_targets=doc_targets,
                     is_significant=False,
                     update_mode='async',
                     triggers_soul=False,
@@ -222,8 +224,8 @@ class EvolutionOrchestrator:
             record = EvolutionRecord(
                 commit_hash=commit_hash,
                 commit_message=commit_info.get('message', ''),
-                changed_files=[c.file_path for c in analysis.changes],
-                doc_targets=list(analysis.doc_targets),
+                changed_files=analysis.changed_files,
+                doc_targets=doc_targets,
                 is_significant=analysis.is_significant,
                 update_mode='async',
                 triggers_soul=analysis.triggers_soul,
@@ -233,7 +235,7 @@ class EvolutionOrchestrator:
             self.database.log_evolution(record)
 
             # Execute async updates
-            for target in analysis.doc_targets:
+            for target in doc_targets:
                 try:
                     # For async, we only update if the target doesn't require sync
                     mapping = self.config.get_mapping_for_file(target)
@@ -346,75 +348,9 @@ class EvolutionOrchestrator:
         return self.database.get_stats()
 
 
-def main():
-    """Main entry point for command-line usage."""
-    parser = argparse.ArgumentParser(
-        description='Orchestrate documentation evolution updates'
-    )
-    parser.add_argument(
-        'command',
-        choices=['sync', 'async', 'process-pending', 'stats'],
-        help='Command to execute'
-    )
-    parser.add_argument(
-        '--commit',
-        help='Commit hash (for async mode)'
-    )
-    parser.add_argument(
-        '--message',
-        help='Commit message (for async mode)'
-    )
-    parser.add_argument(
-        '--json',
-        action='store_true',
-        help='Output as JSON'
-    )
-
-    args = parser.parse_args()
-
-    orchestrator = EvolutionOrchestrator()
-
-    if args.command == 'sync':
-        result = orchestrator.run_sync()
-    elif args.command == 'async':
-        result = orchestrator.run_async(args.commit)
-    elif args.command == 'process-pending':
-        results = orchestrator.process_pending_updates()
-        if args.json:
-            import json
-            print(json.dumps([
-                {
-                    'status': r.status.value,
-                    'updates': r.updates_performed,
-                    'errors': r.errors
-                }
-                for r in results
-            ], indent=2))
-        else:
-            print(f"Processed {len(results)} pending updates")
-            for i, r in enumerate(results):
-                print(f"  {i+1}. {r.status.value}: {len(r.updates_performed)} updates")
-        return 0
-    elif args.command == 'stats':
-        stats = orchestrator.get_stats()
-        if args.json:
-            import json
-            print(json.dumps(stats, indent=2))
-        else:
-            print("Evolution System Statistics:")
-            print(f"  Total records: {stats.get('total_records', 0)}")
-            print(f"  Significant changes: {stats.get('significant_changes', 0)}")
-            print(f"  Soul snapshots: {stats.get('soul_snapshots', 0)}")
-            print(f"  Last 24h: {stats.get('last_24h', 0)}")
-            print("  By status:")
-            for status, count in stats.get('by_status', {}).items():
-                print(f"    {status}: {count}")
-        return 0
-    else:
-        parser.print_help()
-        return 1
-
-    if args.json:
+def _print_result(result: UpdateResult, as_json: bool) -> int:
+    """Print a single update result and return the process exit code."""
+    if as_json:
         import json
         print(json.dumps({
             'status': result.status.value,
@@ -435,5 +371,92 @@ def main():
     return 0 if result.status in [UpdateStatus.COMPLETED, UpdateStatus.SKIPPED] else 1
 
 
+def _cmd_sync(orchestrator: EvolutionOrchestrator, args: argparse.Namespace) -> int:
+    return _print_result(orchestrator.run_sync(), args.json)
+
+
+def _cmd_async(orchestrator: EvolutionOrchestrator, args: argparse.Namespace) -> int:
+    return _print_result(orchestrator.run_async(args.commit), args.json)
+
+
+def _cmd_process_pending(orchestrator: EvolutionOrchestrator, args: argparse.Namespace) -> int:
+    results = orchestrator.process_pending_updates()
+    if args.json:
+        import json
+        print(json.dumps([
+            {
+                'status': r.status.value,
+                'updates': r.updates_performed,
+                'errors': r.errors
+            }
+            for r in results
+        ], indent=2))
+    else:
+        print(f"Processed {len(results)} pending updates")
+        for i, r in enumerate(results):
+            print(f"  {i+1}. {r.status.value}: {len(r.updates_performed)} updates")
+    return 0
+
+
+def _cmd_stats(orchestrator: EvolutionOrchestrator, args: argparse.Namespace) -> int:
+    stats = orchestrator.get_stats()
+    if args.json:
+        import json
+        print(json.dumps(stats, indent=2))
+    else:
+        print("Evolution System Statistics:")
+        print(f"  Total records: {stats.get('total_records', 0)}")
+        print(f"  Significant changes: {stats.get('significant_changes', 0)}")
+        print(f"  Soul snapshots: {stats.get('soul_snapshots', 0)}")
+        print(f"  Last 24h: {stats.get('last_24h', 0)}")
+        print("  By status:")
+        for status, count in stats.get('by_status', {}).items():
+            print(f"    {status}: {count}")
+    return 0
+
+
+COMMANDS: Dict[str, Callable[[EvolutionOrchestrator, argparse.Namespace], int]] = {
+    'sync': _cmd_sync,
+    'async': _cmd_async,
+    'process-pending': _cmd_process_pending,
+    'stats': _cmd_stats,
+}
+
+
+def main():
+    """Main entry point for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description='Orchestrate documentation evolution updates'
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--json',
+        action='store_true',
+        help='Output as JSON'
+    )
+
+    subparsers = parser.add_subparsers(dest='command', required=True, help='Command to execute')
+    subparsers.add_parser('sync', parents=[common], help='Run synchronous (pre-commit) updates')
+    async_parser = subparsers.add_parser(
+        'async', parents=[common], help='Run asynchronous (post-commit) updates'
+    )
+    async_parser.add_argument(
+        '--commit',
+        help='Commit hash (for async mode)'
+    )
+    async_parser.add_argument(
+        '--message',
+        help='Commit message (for async mode)'
+    )
+    subparsers.add_parser('process-pending', parents=[common], help='Process pending async updates')
+    subparsers.add_parser('stats', parents=[common], help='Show evolution statistics')
+
+    args = parser.parse_args()
+
+    # Only build the orchestrator (config, database, updaters) once args are valid
+    orchestrator = EvolutionOrchestrator()
+    return COMMANDS[args.command](orchestrator, args)
+
+
 if __name__ == '__main__':
     sys.exit(main())
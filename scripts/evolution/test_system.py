@@ -8,6 +8,11 @@ without requiring actual git commits.
 
 import sys
 import os
+import io
+import argparse
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to path
@@ -200,8 +205,63 @@ def test_hooks():
     return True
 
 
+class _ThreadLocalOutput(io.TextIOBase):
+    """Route writes to a per-thread buffer so concurrent tests don't interleave."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buffer: io.StringIO) -> None:
+        self._local.buffer = buffer
+
+    def release(self) -> None:
+        self._local.buffer = None
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._fallback).write(text)
+
+    def flush(self) -> None:
+        self._fallback.flush()
+
+
+def _run_test(name, test_func, output=None):
+    """
+    Run a single test and report its outcome.
+
+    Args:
+        name: Display name of the test
+        test_func: Test callable returning True on success
+        output: Optional thread-local output to capture prints into
+
+    Returns:
+        Tuple of (name, status, captured output)
+    """
+    buffer = io.StringIO()
+    if output is not None:
+        output.capture(buffer)
+    try:
+        status = "PASSED" if test_func() else "FAILED"
+    except Exception as e:
+        status = f"ERROR - {e}"
+        buffer.write(traceback.format_exc())
+    finally:
+        if output is not None:
+            output.release()
+    return name, status, buffer.getvalue()
+
+
 def main():
     """Run all tests."""
+    parser = argparse.ArgumentParser(description='Test the evolution system')
+    parser.add_argument(
+        '--serial',
+        action='store_true',
+        help='Run tests one at a time (useful for debugging)'
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Sentient Alpha Evolution System - Test Suite")
     print("=" * 60)
@@ -219,19 +279,36 @@ def main():
     passed = 0
     failed = 0
 
-    for name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-                print(f"  {name}: PASSED")
-            else:
-                failed += 1
-                print(f"  {name}: FAILED")
-        except Exception as e:
+    def report(name, status, output):
+        nonlocal passed, failed
+        if status == "PASSED":
+            passed += 1
+        else:
             failed += 1
-            print(f"  {name}: ERROR - {e}")
-            import traceback
-            traceback.print_exc()
+        if output:
+            print(output, end="")
+        print(f"  {name}: {status}")
+
+    if args.serial:
+        for name, test_func in tests:
+            # Stream output directly so prints show up as the test runs
+            report(*_run_test(name, test_func))
+    else:
+        # Tests are independent and I/O bound (git subprocesses, SQLite),
+        # so overlap them and print each one's output as it completes.
+        original = sys.stdout
+        output = _ThreadLocalOutput(original)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(_run_test, name, test_func, output)
+                    for name, test_func in tests
+                ]
+                for future in as_completed(futures):
+                    report(*future.result())
+        finally:
+            sys.stdout = original
 
     print()
     print("=" * 60)
@@ -5,14 +5,59 @@ Each updater is responsible for updating a specific type of documentation
 based on code changes detected by the analyzer.
 """
 
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 from scripts.evolution.analyzer import ChangeAnalysis
 
+# Maximum number of entries kept in each updater's resolution cache
+RESOLVE_CACHE_SIZE = 128
+
+# Worker threads used to prefetch documentation files
+READ_WORKERS = 8
+
+# Bytes read from the end of a file when probing for a trailing section
+TAIL_READ_SIZE = 4096
+
+_LEVEL2_HEADER_RE = re.compile(rb'(?m)^## ')
+_HEADER_RE = re.compile(r'(?m)^(?:```.*|#{1,6}[ \t].*)$')
+
 
 class BaseUpdater(ABC):
     """Base class for all documentation updaters."""
 
+    # Clock reading shared by every helper during one update() pass
+    _now: Optional[datetime] = None
+    _stamps: Dict[str, str] = {}
+
+    def _start_pass(self) -> None:
+        """Read the clock once for the update() pass that is starting."""
+        self._now = datetime.now()
+        self._stamps = {}
+
+    def _timestamp(self, fmt: str) -> str:
+        """
+        Format the current pass's clock reading.
+
+        Outside an update() pass this falls back to the live clock.
+
+        Args:
+            fmt: strftime format
+
+        Returns:
+            Formatted timestamp, consistent across the whole pass
+        """
+        if self._now is None:
+            return datetime.now().strftime(fmt)
+        stamp = self._stamps.get(fmt)
+        if stamp is None:
+            stamp = self._stamps[fmt] = self._now.strftime(fmt)
+        return stamp
+
     @abstractmethod
     def update(self, target: str, analysis: ChangeAnalysis) -> List[str]:
         """
@@ -41,4 +86,169 @@ class BaseUpdater(ABC):
         pass
 
 
-__all__ = ['BaseUpdater']
+def scan_sections(content: str) -> List[Tuple[int, str]]:
+    """
+    Index every markdown header in a single pass over the content.
+
+    Lines inside fenced code blocks (e.g. shell comments) are not headers.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        List of (offset, header line) in document order
+    """
+    sections = []
+    in_fence = False
+    for match in _HEADER_RE.finditer(content):
+        line = match.group(0).rstrip()
+        if line.startswith('```'):
+            in_fence = not in_fence
+        elif not in_fence:
+            sections.append((match.start(), line))
+    return sections
+
+
+def find_section(
+    sections: List[Tuple[int, str]],
+    section_header: str
+) -> Optional[Tuple[int, int]]:
+    """
+    Locate a section in a header index built by scan_sections.
+
+    Args:
+        sections: Header index for the content
+        section_header: Header to find, e.g. "## Evolution Context"
+
+    Returns:
+        (start, end) offsets where end is the next "##"-or-deeper header, so
+        new entries land right below the section's lead text and above its
+        first subheader (-1 if there is none), or None if missing
+    """
+    for i, (offset, line) in enumerate(sections):
+        if not line.startswith(section_header):
+            continue
+        for next_offset, next_line in sections[i + 1:]:
+            if next_line.startswith('##'):
+                return offset, next_offset
+        return offset, -1
+    return None
+
+
+def read_texts(paths: Iterable[Path]) -> Dict[Path, str]:
+    """
+    Read a batch of text files concurrently.
+
+    Missing, unreadable or non-UTF-8 files are left out of the result so
+    callers can fall back to their own per-file error handling.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        Dict mapping each readable path to its contents
+    """
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+
+    def _read(path: Path) -> Optional[str]:
+        try:
+            return path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(paths))) as executor:
+        contents = executor.map(_read, paths)
+        return {path: text for path, text in zip(paths, contents) if text is not None}
+
+
+def append_to_trailing_section(path: Path, section_header: str, entry: str) -> bool:
+    """
+    Append an entry to a file whose last level-2 section is section_header.
+
+    Only the tail of the file is read and only the entry is written. When the
+    section can't be confirmed as trailing from the tail, the file is left
+    untouched so callers can fall back to a full read-modify-write.
+
+    Args:
+        path: File to append to
+        section_header: Header line of the section, e.g. "## Evolution Context"
+        entry: Text to append after the section's existing content
+
+    Returns:
+        True if the entry was appended
+    """
+    with open(path, 'r+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - TAIL_READ_SIZE)
+        f.seek(start)
+        tail = f.read()
+
+        if b'\r\n' in tail:
+            return False  # Keep line endings consistent via the slow path
+
+        headers = list(_LEVEL2_HEADER_RE.finditer(tail))
+        if not headers or headers[-1].start() == 0 and start > 0:
+            return False  # Header may be cut off at the tail boundary
+        if not tail.startswith(section_header.encode('utf-8'), headers[-1].start()):
+            return False
+
+        # Equivalent to content.rstrip() + "\n" + entry
+        end = start + len(tail.rstrip())
+        f.truncate(end)
+        f.seek(end)
+        f.write(("\n" + entry).encode('utf-8'))
+    return True
+
+
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    """Length of the longest common prefix, found by bisecting with C-level compares."""
+    view_a, view_b = memoryview(a), memoryview(b)
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if view_a[:mid] == view_b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def write_text_delta(path: Path, old: str, new: str) -> None:
+    """
+    Write new content, rewriting only from the first byte that differs from old.
+
+    Appends and trailing-marker replacements therefore touch only the end of
+    the file. Falls back to a full write if the file no longer matches old.
+
+    Args:
+        path: File to write
+        old: Contents the file currently holds
+        new: Contents to write
+    """
+    old_bytes = old.encode('utf-8')
+    if os.path.getsize(path) != len(old_bytes):
+        path.write_text(new, encoding='utf-8')
+        return
+
+    new_bytes = new.encode('utf-8')
+    start = _common_prefix_len(old_bytes, new_bytes)
+    if start == len(old_bytes) == len(new_bytes):
+        return  # Unchanged
+
+    with open(path, 'r+b') as f:
+        f.seek(start)
+        f.write(new_bytes[start:])
+        f.truncate()
+
+
+__all__ = [
+    'BaseUpdater',
+    'RESOLVE_CACHE_SIZE',
+    'append_to_trailing_section',
+    'find_section',
+    'read_texts',
+    'scan_sections',
+    'write_text_delta',
+]
@@ -6,12 +6,31 @@ Updates ai-env/personas/ files when agent logic changes are detected.
 
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Set
-from datetime import datetime
-
-from scripts.evolution.updaters import BaseUpdater
+from typing import List, Optional, Dict, Set, FrozenSet, Tuple
+
+from scripts.evolution.updaters import (
+    BaseUpdater,
+    RESOLVE_CACHE_SIZE,
+    append_to_trailing_section,
+    find_section,
+    scan_sections,
+)
 from scripts.evolution.analyzer import ChangeAnalysis, ChangeType
 
+_AGENT_RE = re.compile(r'engine/agents/(\w+)\.py')
+
+# Keywords in priority order (first match wins) and their summary labels
+_LOGIC_LABELS = {
+    'brain': "Brain decision logic",
+    'hand': "Hand execution logic",
+    'senses': "Senses data collection",
+    'soul': "Soul orchestration",
+}
+_LOGIC_KW_RE = re.compile('|'.join(f'(?P<{kw}>{kw})' for kw in _LOGIC_LABELS))
+
+# Sorted changed paths -> resolved agent names
+_RESOLVE_CACHE: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
 
 class PersonaUpdater(BaseUpdater):
     """Updates persona documentation based on agent logic changes."""
@@ -24,6 +43,10 @@ class PersonaUpdater(BaseUpdater):
         'soul': 'optimist',
     }
 
+    def __init__(self):
+        # (directory mtime_ns, persona files) from the last directory listing
+        self._persona_cache: Optional[Tuple[int, List[Path]]] = None
+
     def can_handle(self, target: str) -> bool:
         """Check if this updater can handle the target."""
         return 'persona' in target.lower()
@@ -39,7 +62,10 @@ class PersonaUpdater(BaseUpdater):
         Returns:
             List of updated persona files
         """
-        updated = []
+        self._start_pass()
+
+        # Insertion-ordered set of updated paths
+        updated: Dict[str, None] = {}
 
         # Determine which agents were modified
         modified_agents = self._get_modified_agents(analysis)
@@ -48,27 +74,46 @@ class PersonaUpdater(BaseUpdater):
             persona_file = self._get_persona_for_agent(agent_name)
             if persona_file and persona_file.exists():
                 if self._update_persona_file(persona_file, agent_name, analysis):
-                    updated.append(str(persona_file))
+                    updated[str(persona_file)] = None
 
         # Also update if new logic gates were detected
         if self._has_logic_changes(analysis):
-            for persona_file in self.PERSONA_DIR.glob("*.md"):
+            for persona_file in self._persona_files():
                 if self._append_logic_context(persona_file, analysis):
-                    if str(persona_file) not in updated:
-                        updated.append(str(persona_file))
+                    updated[str(persona_file)] = None
+
+        return list(updated)
+
+    def _persona_files(self) -> List[Path]:
+        """List persona files, rescanning only when the directory has changed."""
+        try:
+            dir_mtime = self.PERSONA_DIR.stat().st_mtime_ns
+        except OSError:
+            return []
 
-        return updated
+        if self._persona_cache is None or self._persona_cache[0] != dir_mtime:
+            self._persona_cache = (dir_mtime, list(self.PERSONA_DIR.glob("*.md")))
+        return self._persona_cache[1]
 
     def _get_modified_agents(self, analysis: ChangeAnalysis) -> Set[str]:
         """Extract agent names from modified files."""
+        key = tuple(sorted(analysis.changed_files))
+        cached = _RESOLVE_CACHE.get(key)
+        if cached is not None:
+            return set(cached)
+
         agents = set()
 
         for change in analysis.changes:
             # Match engine/agents/{agent_name}.py
-            match = re.search(r'engine/agents/(\w+)\.py', change.file_path)
+            match = _AGENT_RE.search(change.file_path)
             if match:
                 agents.add(match.group(1).lower())
 
+        if len(_RESOLVE_CACHE) >= RESOLVE_CACHE_SIZE:
+            _RESOLVE_CACHE.pop(next(iter(_RESOLVE_CACHE)))
+        _RESOLVE_CACHE[key] = frozenset(agents)
+
         return agents
 
     def _get_persona_for_agent(self, agent_name: str) -> Optional[Path]:
@@ -133,19 +178,23 @@ class PersonaUpdater(BaseUpdater):
     ) -> bool:
         """Append logic context to persona file."""
         try:
-            content = persona_file.read_text(encoding='utf-8')
-
             # Extract logic changes summary
             logic_summary = self._extract_logic_summary(analysis)
             if not logic_summary:
                 return False
 
             section = f"""
-### Logic Update [{datetime.now().strftime('%Y-%m-%d')}]
+### Logic Update [{self._timestamp('%Y-%m-%d')}]
 - **Files Modified**: {len([c for c in analysis.changes if 'agents' in c.file_path])}
 - **Key Changes**: {logic_summary}
 """
 
+            # Fast path: the section already ends the file, so append only the entry
+            if append_to_trailing_section(persona_file, "## Recent Logic Updates", section):
+                return True
+
+            content = persona_file.read_text(encoding='utf-8')
+
             if "## Recent Logic Updates" in content:
                 content = self._append_to_section(
                     content,
@@ -168,13 +217,14 @@ class PersonaUpdater(BaseUpdater):
         analysis: ChangeAnalysis
     ) -> str:
         """Generate an evolution context section."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+        timestamp = self._timestamp('%Y-%m-%d %H:%M')
 
         # Get files related to this agent
         agent_files = [
             c.file_path for c in analysis.changes
             if agent_name in c.file_path.lower()
         ]
+        files_changed = "\n".join([f"- `{f}`" for f in agent_files])
 
         return f"""## Evolution Context
 
@@ -183,7 +233,7 @@ class PersonaUpdater(BaseUpdater):
 **Agent Modified**: `{agent_name}`
 
 **Files Changed**:
-{chr(10).join(f"- `{f}`" for f in agent_files)}
+{files_changed}
 
 **Impact**: Logic changes may affect decision thresholds and behavior patterns.
 Review related logic gates in `ai-env/schemas/logic_gates.md`.
@@ -191,29 +241,24 @@ Review related logic gates in `ai-env/schemas/logic_gates.md`.
 
     def _extract_logic_summary(self, analysis: ChangeAnalysis) -> str:
         """Extract a summary of logic changes from analysis."""
-        summaries = []
+        summaries = set()
 
         for change in analysis.changes:
-            if 'brain' in change.file_path:
-                summaries.append("Brain decision logic")
-            elif 'hand' in change.file_path:
-                summaries.append("Hand execution logic")
-            elif 'senses' in change.file_path:
-                summaries.append("Senses data collection")
-            elif 'soul' in change.file_path:
-                summaries.append("Soul orchestration")
+            found = {m.lastgroup for m in _LOGIC_KW_RE.finditer(change.file_path)}
+            for keyword, label in _LOGIC_LABELS.items():
+                if keyword in found:
+                    summaries.add(label)
+                    break
 
-        return ", ".join(set(summaries)) if summaries else "General logic updates"
+        return ", ".join(summaries) if summaries else "General logic updates"
 
     def _append_to_section(self, content: str, section_header: str, new_content: str) -> str:
         """Append content to an existing section."""
-        # Find the section
-        section_start = content.find(section_header)
-        if section_start == -1:
+        # Find the section and the one after it from a single header scan
+        bounds = find_section(scan_sections(content), section_header)
+        if bounds is None:
             return content + new_content
-
-        # Find the next section (if any)
-        next_section = content.find("##", section_start + len(section_header))
+        _, next_section = bounds
 
         if next_section == -1:
             # Append to end of content
@@ -5,14 +5,185 @@ Updates ai-env/schemas/ files when core data structures or schemas change.
 """
 
 import re
+import os
 import ast
+import json
+import atexit
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Set, Tuple
-from datetime import datetime
 
-from scripts.evolution.updaters import BaseUpdater
+from scripts.evolution.updaters import BaseUpdater, read_texts, write_text_delta
 from scripts.evolution.analyzer import ChangeAnalysis, ChangeType
 
+# Try to use orjson for cache serialization, fall back to the stdlib
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+_MARKER_START = "---\n\n*Last schema evolution:"
+_TRIGGERED_BY = "*Triggered by changes in: "
+_EVO_MARKER_RE = re.compile(r'\n---\n\n\*Last schema evolution:.*?\*', re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def _match_source_pattern(file_path: str, pattern: str) -> bool:
+    """Check (once per path/pattern pair) whether a file path matches a mapping pattern."""
+    return pattern in file_path or file_path.endswith(pattern.replace('*', ''))
+
+
+@lru_cache(maxsize=256)
+def _class_section_re(class_name: str) -> re.Pattern:
+    """Compile (once per class name) the pattern locating a class's doc section."""
+    return re.compile(rf"(##?\s*{class_name}.*?)(\n##|\Z)", re.DOTALL)
+
+
+# On-disk cache of extracted schema info, keyed by source content hash
+AST_CACHE_DIR = Path(__file__).parent.parent.parent.parent / ".evolution-cache" / "ast"
+
+# Cache writes happen off the caller's path; pending writes flush at exit
+_CACHE_WRITER: Optional[ThreadPoolExecutor] = None
+
+
+def _cache_writer() -> ThreadPoolExecutor:
+    """Get the background cache writer, starting it on first use."""
+    global _CACHE_WRITER
+    if _CACHE_WRITER is None:
+        _CACHE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ast-cache")
+        atexit.register(_CACHE_WRITER.shutdown, wait=True)
+    return _CACHE_WRITER
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a cache file via a temporary file so readers never see partial JSON."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def ast_cache_enabled() -> bool:
+    """Check whether the AST extraction cache is enabled (EVOLUTION_AST_CACHE=1)."""
+    return os.getenv("EVOLUTION_AST_CACHE") == "1"
+
+
+class AstCache:
+    """
+    On-disk cache of per-file schema extraction results.
+
+    Entries are keyed by a hash of the file path and contents.
+    """
+
+    def __init__(self, cache_dir: Path = AST_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key_for(source_file: str, data: bytes) -> str:
+        """Cache key for a file's path and contents."""
+        return hashlib.sha256(source_file.encode('utf-8') + b"\0" + data).hexdigest()[:16]
+
+    def get(self, source_file: str, data: bytes) -> Optional[List[Dict]]:
+        """
+        Look up cached schema classes for a file.
+
+        Args:
+            source_file: Path of the source file
+            data: Current file contents
+
+        Returns:
+            Cached class dicts, or None on a miss (including unreadable entries)
+        """
+        cache_file = self.cache_dir / f"{self.key_for(source_file, data)}.json"
+        try:
+            if not cache_file.exists():
+                return None
+            classes = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None  # The caller re-parses
+
+        return classes
+
+    def put(self, source_file: str, data: bytes, classes: List[Dict]) -> None:
+        """Store the extraction result for a file's current contents."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Serialize now so later mutations can't race the background write
+        _cache_writer().submit(
+            _atomic_write,
+            self.cache_dir / f"{self.key_for(source_file, data)}.json",
+            _dumps(classes)
+        )
+
+
+def _extract_schema_from_source(source_content: str, source_file: str) -> List[Dict]:
+    """Parse a single source file and extract its module-level schema classes."""
+    updates = []
+    tree = ast.parse(source_content, filename=source_file, type_comments=False)
+
+    # Find dataclasses (schema classes are defined at module level)
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, ast.ClassDef):
+            update = _process_class_def(node, source_file)
+            if update:
+                updates.append(update)
+
+    return updates
+
+
+def _process_class_def(node: ast.ClassDef, source_file: str) -> Optional[Dict]:
+    """Process a class definition to extract schema information."""
+    # Check if it's a dataclass or similar schema class
+    is_dataclass = any(
+        isinstance(decorator, ast.Name) and decorator.id == 'dataclass'
+        for decorator in node.decorator_list
+    )
+
+    if not is_dataclass and not node.name.endswith(('Model', 'Schema', 'Config')):
+        return None
+
+    fields = []
+    for item in node.body:
+        if isinstance(item, ast.AnnAssign):
+            field_name = item.target.id if isinstance(item.target, ast.Name) else str(item.target)
+            field_type = _get_type_string(item.annotation)
+            fields.append({
+                'name': field_name,
+                'type': field_type
+            })
+
+    return {
+        'class_name': node.name,
+        'source_file': source_file,
+        'fields': fields
+    }
+
+
+def _get_type_string(annotation: ast.AST) -> str:
+    """Convert an AST annotation to a type string."""
+    if isinstance(annotation, ast.Name):
+        return annotation.id
+    elif isinstance(annotation, ast.Subscript):
+        value = _get_type_string(annotation.value)
+        slice_val = _get_type_string(annotation.slice)
+        return f"{value}[{slice_val}]"
+    elif isinstance(annotation, ast.Constant):
+        return str(annotation.value)
+    elif isinstance(annotation, ast.Attribute):
+        return f"{_get_type_string(annotation.value)}.{annotation.attr}"
+    else:
+        return str(annotation)
+
+
+def _parse_one(source_file: str, source_bytes: bytes) -> List[Dict]:
+    """Extract schema classes from one file's raw bytes."""
+    return _extract_schema_from_source(source_bytes.decode('utf-8'), source_file)
+
 
 class SchemaUpdater(BaseUpdater):
     """Updates schema documentation based on code changes."""
@@ -44,15 +215,21 @@ class SchemaUpdater(BaseUpdater):
         Returns:
             List of updated schema files
         """
+        self._start_pass()
         updated = []
 
         # Determine which schema files need updating
         schema_files_to_update = self._determine_schema_updates(analysis)
 
+        # Read every target schema up front instead of one at a time
+        contents = read_texts(self.SCHEMA_DIR / f for f in schema_files_to_update)
+
         for schema_file, source_files in schema_files_to_update.items():
             schema_path = self.SCHEMA_DIR / schema_file
-            if schema_path.exists():
-                if self._update_schema_file(schema_path, source_files, analysis):
+            if schema_path in contents:
+                if self._update_schema_file(
+                    schema_path, source_files, analysis, contents[schema_path]
+                ):
                     updated.append(str(schema_path))
 
         return updated
@@ -64,29 +241,28 @@ class SchemaUpdater(BaseUpdater):
         Returns:
             Dict mapping schema file to list of source files that triggered update
         """
-        updates: Dict[str, List[str]] = {}
+        # Dicts act as insertion-ordered sets so doc output stays deterministic
+        updates: Dict[str, Dict[str, None]] = {}
 
         for change in analysis.changes:
             for source_pattern, schema_files in self.SCHEMA_MAPPINGS.items():
                 if self._match_pattern(change.file_path, source_pattern):
                     for schema_file in schema_files:
-                        if schema_file not in updates:
-                            updates[schema_file] = []
-                        if change.file_path not in updates[schema_file]:
-                            updates[schema_file].append(change.file_path)
+                        updates.setdefault(schema_file, {})[change.file_path] = None
 
-        return updates
+        return {schema_file: list(sources) for schema_file, sources in updates.items()}
 
     def _match_pattern(self, file_path: str, pattern: str) -> bool:
         """Check if a file path matches a pattern."""
         # Simple pattern matching - can be enhanced
-        return pattern in file_path or file_path.endswith(pattern.replace('*', ''))
+        return _match_source_pattern(file_path, pattern)
 
     def _update_schema_file(
         self,
         schema_path: Path,
         source_files: List[str],
-        analysis: ChangeAnalysis
+        analysis: ChangeAnalysis,
+        content: Optional[str] = None
     ) -> bool:
         """
         Update a specific schema file.
@@ -95,16 +271,23 @@ class SchemaUpdater(BaseUpdater):
             schema_path: Path to the schema file
             source_files: List of source files that triggered this update
             analysis: The change analysis
+            content: Pre-read file contents, or None to read from disk
 
         Returns:
             True if file was updated
         """
         try:
-            content = schema_path.read_text(encoding='utf-8')
+            if content is None:
+                content = schema_path.read_text(encoding='utf-8')
+            original = content
 
             # Extract new schema information from source files
             schema_updates = self._extract_schema_from_sources(source_files)
 
+            # Nothing schema-shaped changed and the doc already reflects these sources
+            if not schema_updates and self._marker_is_current(schema_path, content, source_files):
+                return False
+
             # Update the schema file
             for update in schema_updates:
                 content = self._apply_schema_update(content, update)
@@ -112,20 +295,42 @@ class SchemaUpdater(BaseUpdater):
             # Add evolution marker
             content = self._add_evolution_marker(content, source_files, analysis)
 
-            schema_path.write_text(content, encoding='utf-8')
+            # Typically only the trailing evolution marker changes on disk
+            write_text_delta(schema_path, original, content)
             return True
 
         except Exception as e:
             print(f"Error updating schema file {schema_path}: {e}")
             return False
 
+    def _marker_is_current(self, schema_path: Path, content: str, source_files: List[str]) -> bool:
+        """
+        Check whether a schema doc is already up to date for the given sources.
+
+        True when the trailing evolution marker lists exactly these source
+        files, or when the doc was modified after every source file.
+        """
+        _, sep, listed = content[-512:].rpartition(_TRIGGERED_BY)
+        if sep:
+            listed_files = [f.strip().strip('`') for f in listed.split('*', 1)[0].split(',')]
+            if sorted(listed_files) == sorted(source_files):
+                return True
+
+        try:
+            schema_mtime = schema_path.stat().st_mtime_ns
+            return all(Path(f).stat().st_mtime_ns < schema_mtime for f in source_files)
+        except OSError:
+            return False
+
     def _extract_schema_from_sources(self, source_files: List[str]) -> List[Dict]:
         """
         Extract schema information from source files.
 
         This parses Python files to find dataclasses, TypedDicts, and other
-        schema-defining structures.
+        schema-defining structures. When EVOLUTION_AST_CACHE=1, results are
+        cached on disk by content hash so unchanged files skip parsing.
         """
+        cache = AstCache() if ast_cache_enabled() else None
         updates = []
 
         for source_file in source_files:
@@ -134,15 +339,22 @@ class SchemaUpdater(BaseUpdater):
                 continue
 
             try:
-                source_content = source_path.read_text(encoding='utf-8')
-                tree = ast.parse(source_content)
+                source_bytes = source_path.read_bytes()
 
-                # Find dataclasses
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        update = self._process_class_def(node, source_file)
-                        if update:
-                            updates.append(update)
+                if cache is not None:
+                    cached = cache.get(source_file, source_bytes)
+                    if cached is not None:
+                        updates.extend(cached)
+                        continue
+
+                file_updates = _parse_one(source_file, source_bytes)
+                updates.extend(file_updates)
+
+                if cache is not None:
+                    try:
+                        cache.put(source_file, source_bytes, file_updates)
+                    except OSError as e:
+                        print(f"Warning: Could not cache {source_file}: {e}")
 
             except SyntaxError:
                 # Skip files with syntax errors
@@ -153,48 +365,6 @@ class SchemaUpdater(BaseUpdater):
 
         return updates
 
-    def _process_class_def(self, node: ast.ClassDef, source_file: str) -> Optional[Dict]:
-        """Process a class definition to extract schema information."""
-        # Check if it's a dataclass or similar schema class
-        is_dataclass = any(
-            isinstance(decorator, ast.Name) and decorator.id == 'dataclass'
-            for decorator in node.decorator_list
-        )
-
-        if not is_dataclass and not node.name.endswith(('Model', 'Schema', 'Config')):
-            return None
-
-        fields = []
-        for item in node.body:
-            if isinstance(item, ast.AnnAssign):
-                field_name = item.target.id if isinstance(item.target, ast.Name) else str(item.target)
-                field_type = self._get_type_string(item.annotation)
-                fields.append({
-                    'name': field_name,
-                    'type': field_type
-                })
-
-        return {
-            'class_name': node.name,
-            'source_file': source_file,
-            'fields': fields
-        }
-
-    def _get_type_string(self, annotation: ast.AST) -> str:
-        """Convert an AST annotation to a type string."""
-        if isinstance(annotation, ast.Name):
-            return annotation.id
-        elif isinstance(annotation, ast.Subscript):
-            value = self._get_type_string(annotation.value)
-            slice_val = self._get_type_string(annotation.slice)
-            return f"{value}[{slice_val}]"
-        elif isinstance(annotation, ast.Constant):
-            return str(annotation.value)
-        elif isinstance(annotation, ast.Attribute):
-            return f"{self._get_type_string(annotation.value)}.{annotation.attr}"
-        else:
-            return str(annotation)
-
     def _apply_schema_update(self, content: str, update: Dict) -> str:
         """Apply a schema update to the content."""
         class_name = update['class_name']
@@ -211,13 +381,12 @@ class SchemaUpdater(BaseUpdater):
         """Update existing schema documentation."""
         # This is a simplified implementation
         # In practice, you'd want more sophisticated merging
-        timestamp = datetime.now().strftime('%Y-%m-%d')
+        timestamp = self._timestamp('%Y-%m-%d')
 
         update_marker = f"\n\n> **Auto-updated**: {timestamp} from `{update['source_file']}`\n"
 
         # Find the class section and append update marker
-        class_pattern = rf"(##?\s*{update['class_name']}.*?)(\n##|\Z)"
-        match = re.search(class_pattern, content, re.DOTALL)
+        match = _class_section_re(update['class_name']).search(content)
 
         if match:
             insert_pos = match.end(1)
@@ -227,9 +396,10 @@ class SchemaUpdater(BaseUpdater):
 
     def _add_new_schema(self, content: str, update: Dict) -> str:
         """Add new schema documentation."""
-        timestamp = datetime.now().strftime('%Y-%m-%d')
+        timestamp = self._timestamp('%Y-%m-%d')
+        rows = [f"| `{field['name']}` | `{field['type']}` |\n" for field in update['fields']]
 
-        new_section = f"""
+        header = f"""
 
 ## {update['class_name']}
 
@@ -241,10 +411,7 @@ class SchemaUpdater(BaseUpdater):
 | Field | Type |
 |-------|------|
 """
-        for field in update['fields']:
-            new_section += f"| `{field['name']}` | `{field['type']}` |\n"
-
-        return content.rstrip() + new_section
+        return "".join([content.rstrip(), header, *rows])
 
     def _add_evolution_marker(
         self,
@@ -253,24 +420,30 @@ class SchemaUpdater(BaseUpdater):
         analysis: ChangeAnalysis
     ) -> str:
         """Add an evolution marker to track when the schema was last updated."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+        timestamp = self._timestamp('%Y-%m-%d %H:%M')
+        triggered_by = ', '.join([f'`{f}`' for f in source_files])
 
         marker = f"""\n
 ---
 
 *Last schema evolution: {timestamp}*
-*Triggered by changes in: {', '.join(f'`{f}`' for f in source_files)}*
+{_TRIGGERED_BY}{triggered_by}*
 """
 
-        # Check if there's already an evolution marker
-        if "*Last schema evolution:" in content:
+        # The marker sits near the end, so search backwards from the tail
+        start = content.rfind(_MARKER_START)
+        if start != -1:
+            # Replace the marker block, including any repeated trigger lines
+            end = content.find("\n", start + len(_MARKER_START))
+            while end != -1 and content.startswith(_TRIGGERED_BY, end + 1):
+                end = content.find("\n", end + 1)
+            rest = content[end + 1:].lstrip("\n") if end != -1 else ""
+            if rest:
+                rest = "\n" + rest
+            content = content[:start].rstrip() + marker + rest
+        elif "*Last schema evolution:" in content:
             # Replace existing marker
-            content = re.sub(
-                r'\n---\n\n\*Last schema evolution:.*?\*',
-                marker.strip(),
-                content,
-                flags=re.DOTALL
-            )
+            content = _EVO_MARKER_RE.sub(marker.strip(), content)
         else:
             content = content.rstrip() + marker
 
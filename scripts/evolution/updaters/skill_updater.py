@@ -6,12 +6,25 @@ Updates ai-env/skills/ documentation when related code or skill definitions chan
 
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Set
-from datetime import datetime
-
-from scripts.evolution.updaters import BaseUpdater
+from typing import List, Optional, Dict, Set, FrozenSet, Tuple
+
+from scripts.evolution.updaters import (
+    BaseUpdater,
+    RESOLVE_CACHE_SIZE,
+    find_section,
+    read_texts,
+    scan_sections,
+    write_text_delta,
+)
 from scripts.evolution.analyzer import ChangeAnalysis, ChangeType
 
+_SKILL_RE = re.compile(r'ai-env/skills/([^/]+)')
+_LAST_MOD_RE = re.compile(r'last_modified:.*')
+_DESC_RE = re.compile(r'(description:.*)')
+
+# Sorted changed paths -> resolved skill names
+_RESOLVE_CACHE: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
 
 class SkillUpdater(BaseUpdater):
     """Updates skill documentation based on code changes."""
@@ -46,21 +59,30 @@ class SkillUpdater(BaseUpdater):
         Returns:
             List of updated skill files
         """
+        self._start_pass()
         updated = []
 
         # Determine which skills need updating
         skills_to_update = self._determine_skills_to_update(analysis)
 
+        # Read every target skill file up front instead of one at a time
+        contents = read_texts(self.SKILLS_DIR / name / "SKILL.md" for name in skills_to_update)
+
         for skill_name in skills_to_update:
             skill_file = self.SKILLS_DIR / skill_name / "SKILL.md"
-            if skill_file.exists():
-                if self._update_skill_file(skill_file, skill_name, analysis):
+            if skill_file in contents:
+                if self._update_skill_file(skill_file, skill_name, analysis, contents[skill_file]):
                     updated.append(str(skill_file))
 
         return updated
 
     def _determine_skills_to_update(self, analysis: ChangeAnalysis) -> Set[str]:
         """Determine which skills need updating based on changed files."""
+        key = tuple(sorted(analysis.changed_files))
+        cached = _RESOLVE_CACHE.get(key)
+        if cached is not None:
+            return set(cached)
+
         skills = set()
 
         for change in analysis.changes:
@@ -68,14 +90,17 @@ class SkillUpdater(BaseUpdater):
 
             # Check direct skill changes
             if 'ai-env/skills/' in file_path:
-                skill_match = re.search(r'ai-env/skills/([^/]+)', file_path)
+                skill_match = _SKILL_RE.search(file_path)
                 if skill_match:
                     skills.add(skill_match.group(1))
 
             # Check code-to-skill mappings
-            for code_pattern, mapped_skills in self.CODE_TO_SKILL_MAPPINGS.items():
-                if code_pattern in file_path or file_path.startswith(code_pattern):
-                    skills.update(mapped_skills)
+            for code_pattern in _match_code_patterns(file_path):
+                skills.update(self.CODE_TO_SKILL_MAPPINGS[code_pattern])
+
+        if len(_RESOLVE_CACHE) >= RESOLVE_CACHE_SIZE:
+            _RESOLVE_CACHE.pop(next(iter(_RESOLVE_CACHE)))
+        _RESOLVE_CACHE[key] = frozenset(skills)
 
         return skills
 
@@ -83,7 +108,8 @@ class SkillUpdater(BaseUpdater):
         self,
         skill_file: Path,
         skill_name: str,
-        analysis: ChangeAnalysis
+        analysis: ChangeAnalysis,
+        content: Optional[str] = None
     ) -> bool:
         """
         Update a specific skill file.
@@ -92,12 +118,15 @@ class SkillUpdater(BaseUpdater):
             skill_file: Path to the skill file
             skill_name: Name of the skill
             analysis: The change analysis
+            content: Pre-read file contents, or None to read from disk
 
         Returns:
             True if file was updated
         """
         try:
-            content = skill_file.read_text(encoding='utf-8')
+            if content is None:
+                content = skill_file.read_text(encoding='utf-8')
+            original = content
 
             # Get relevant changes for this skill
             relevant_changes = self._get_relevant_changes(skill_name, analysis)
@@ -111,7 +140,8 @@ class SkillUpdater(BaseUpdater):
             # Update the last modified timestamp
             content = self._update_timestamp(content)
 
-            skill_file.write_text(content, encoding='utf-8')
+            # Only the appended entry hits disk when the section trails the file
+            write_text_delta(skill_file, original, content)
             return True
 
         except Exception as e:
@@ -125,16 +155,16 @@ class SkillUpdater(BaseUpdater):
     ) -> List[str]:
         """Get changes relevant to a specific skill."""
         relevant = []
+        skill_patterns = {
+            code_pattern
+            for code_pattern, mapped_skills in self.CODE_TO_SKILL_MAPPINGS.items()
+            if skill_name in mapped_skills
+        }
 
         for change in analysis.changes:
-            file_path = change.file_path
-
             # Check if this change is relevant to the skill
-            for code_pattern, mapped_skills in self.CODE_TO_SKILL_MAPPINGS.items():
-                if skill_name in mapped_skills:
-                    if code_pattern in file_path or file_path.startswith(code_pattern):
-                        relevant.append(file_path)
-                        break
+            if _match_code_patterns(change.file_path) & skill_patterns:
+                relevant.append(change.file_path)
 
         return relevant
 
@@ -145,7 +175,7 @@ class SkillUpdater(BaseUpdater):
         relevant_changes: List[str]
     ) -> str:
         """Update or add the evolution context section."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+        timestamp = self._timestamp('%Y-%m-%d %H:%M')
 
         evolution_entry = f"""
 ### Evolution Entry [{timestamp}]
@@ -155,10 +185,12 @@ class SkillUpdater(BaseUpdater):
         if len(relevant_changes) > 3:
             evolution_entry += f"- **Additional**: {len(relevant_changes) - 3} more files\n"
 
-        if "## Evolution Context" in content:
+        sections = scan_sections(content)
+        bounds = find_section(sections, "## Evolution Context")
+
+        if bounds is not None:
             # Append to existing section
-            section_start = content.find("## Evolution Context")
-            next_section = content.find("##", section_start + 1)
+            _, next_section = bounds
 
             if next_section == -1:
                 content = content.rstrip() + evolution_entry
@@ -170,11 +202,13 @@ class SkillUpdater(BaseUpdater):
                 )
         else:
             # Add new section before any scripts section or at end
-            scripts_section = content.find("## Scripts")
-            if scripts_section == -1:
-                scripts_section = content.find("## 📝 Automation Scripts")
+            scripts_bounds = (
+                find_section(sections, "## Scripts")
+                or find_section(sections, "## 📝 Automation Scripts")
+            )
 
-            if scripts_section != -1:
+            if scripts_bounds is not None:
+                scripts_section = scripts_bounds[0]
                 content = (
                     content[:scripts_section].rstrip() +
                     "\n\n## Evolution Context\n" +
@@ -188,23 +222,48 @@ class SkillUpdater(BaseUpdater):
 
     def _update_timestamp(self, content: str) -> str:
         """Update the last modified timestamp in the skill file."""
-        timestamp = datetime.now().strftime('%Y-%m-%d')
+        timestamp = self._timestamp('%Y-%m-%d')
 
         # Look for existing timestamp in frontmatter
         if "---" in content[:100]:
+            # Only the frontmatter block is searched, not the whole document
+            frontmatter_end = content.find("\n---", content.find("---") + 3)
+            if frontmatter_end == -1:
+                frontmatter_end = len(content)
+            frontmatter, body = content[:frontmatter_end], content[frontmatter_end:]
+
             # Update or add last_modified field
-            if "last_modified:" in content:
-                content = re.sub(
-                    r'last_modified:.*',
-                    f'last_modified: {timestamp}',
-                    content
-                )
+            if "last_modified:" in frontmatter:
+                frontmatter = _LAST_MOD_RE.sub(f'last_modified: {timestamp}', frontmatter)
             else:
                 # Add last_modified after description
-                content = re.sub(
-                    r'(description:.*)',
-                    rf'\1\nlast_modified: {timestamp}',
-                    content
-                )
+                frontmatter = _DESC_RE.sub(rf'\1\nlast_modified: {timestamp}', frontmatter)
+            content = frontmatter + body
 
         return content
+
+
+def _build_code_pattern_scanner() -> Tuple[re.Pattern, Dict[str, FrozenSet[str]]]:
+    """
+    Build one scanner for every CODE_TO_SKILL_MAPPINGS key.
+
+    Keys are tried longest first inside a lookahead so every position is
+    checked; each key also implies the shorter keys it contains (e.g.
+    'engine/core/auth' implies 'engine/core'), so one pass finds every key
+    that occurs in a path.
+    """
+    keys = sorted(SkillUpdater.CODE_TO_SKILL_MAPPINGS, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(k) for k in keys) + '))')
+    implied = {key: frozenset(k for k in keys if k in key) for key in keys}
+    return pattern, implied
+
+
+_CODE_PATTERN_RE, _CODE_PATTERN_IMPLIES = _build_code_pattern_scanner()
+
+
+def _match_code_patterns(file_path: str) -> Set[str]:
+    """Return every CODE_TO_SKILL_MAPPINGS key that occurs in the path."""
+    matched: Set[str] = set()
+    for match in _CODE_PATTERN_RE.finditer(file_path):
+        matched |= _CODE_PATTERN_IMPLIES[match.group(1)]
+    return matched
@@ -45,6 +45,7 @@ class SoulUpdater(BaseUpdater):
         Returns:
             List of updated files
         """
+        self._start_pass()
         updated = []
 
         if analysis.triggers_soul and analysis.is_significant:
@@ -70,7 +71,7 @@ class SoulUpdater(BaseUpdater):
         """
         try:
             # Generate snapshot filename
-            timestamp = datetime.now()
+            timestamp = self._now or datetime.now()
             date_str = timestamp.strftime('%Y-%m-%d')
             time_str = timestamp.strftime('%H%M%S')
 
@@ -208,7 +209,7 @@ The changes documented here represent a material shift in:
             content = self.IDENTITY_FILE.read_text(encoding='utf-8')
 
             # Generate evolution entry
-            timestamp = datetime.now().strftime('%Y-%m-%d')
+            timestamp = self._timestamp('%Y-%m-%d')
             commit_info = self.git.get_last_commit_info()
             short_hash = commit_info.get('hash', 'unknown')[:8]
 
@@ -5,14 +5,30 @@ Updates ai-env/workflows/ files when workflow definitions or related code change
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Set
-from datetime import datetime
+from typing import List, Optional, Dict, Set, FrozenSet, Tuple
 
-from scripts.evolution.updaters import BaseUpdater
+from scripts.evolution.updaters import BaseUpdater, read_texts, write_text_delta
 from scripts.evolution.analyzer import ChangeAnalysis, ChangeType
 
 
+_WORKFLOW_FILE_RE = re.compile(r'ai-env/workflows/(\w+)\.md')
+_LAST_UPDATED_RE = re.compile(r'\*\*Last Updated\*\*:?', re.IGNORECASE)
+_LAST_UPDATED_SUB = re.compile(r'(\*\*Last Updated\*\*:\s*)\d{4}-\d{2}-\d{2}', re.IGNORECASE)
+_DEPS_RE = re.compile(r'## Dependencies.*?\n(?=##|$)', re.DOTALL)
+_LAST_UPDATED = "**Last Updated**: "
+_EVOLUTION_NOTE = "*Evolution Note"
+
+
+def _is_date(text: str) -> bool:
+    """Check whether text is a YYYY-MM-DD date."""
+    return (
+        len(text) == 10 and text[4] == '-' and text[7] == '-'
+        and (text[:4] + text[5:7] + text[8:]).isdigit()
+    )
+
+
 class WorkflowUpdater(BaseUpdater):
     """Updates workflow documentation based on code changes."""
 
@@ -41,16 +57,34 @@ class WorkflowUpdater(BaseUpdater):
         Returns:
             List of updated workflow files
         """
+        self._start_pass()
         updated = []
 
         # Determine which workflows need updating
         workflows_to_update = self._determine_workflows_to_update(analysis)
 
+        # Read every target workflow file up front instead of one at a time
+        contents = read_texts(self.WORKFLOWS_DIR / f"{name}.md" for name in workflows_to_update)
+
+        # Compose every file's new contents before touching the disk
+        pending = []
         for workflow_name in workflows_to_update:
             workflow_file = self.WORKFLOWS_DIR / f"{workflow_name}.md"
-            if workflow_file.exists():
-                if self._update_workflow_file(workflow_file, workflow_name, analysis):
-                    updated.append(str(workflow_file))
+            if workflow_file not in contents:
+                continue
+            relevant_changes = self._get_relevant_changes(workflow_name, analysis)
+            new_content = self._update_workflow_file(
+                workflow_file, relevant_changes, contents[workflow_file]
+            )
+            if new_content is not None:
+                pending.append((workflow_file, contents[workflow_file], new_content))
+
+        for workflow_file, original, new_content in pending:
+            try:
+                write_text_delta(workflow_file, original, new_content)
+                updated.append(str(workflow_file))
+            except Exception as e:
+                print(f"Error writing workflow file {workflow_file}: {e}")
 
         return updated
 
@@ -63,45 +97,36 @@ class WorkflowUpdater(BaseUpdater):
 
             # Check if workflow file itself changed
             if 'ai-env/workflows/' in file_path:
-                workflow_match = re.search(r'ai-env/workflows/(\w+)\.md', file_path)
+                workflow_match = _WORKFLOW_FILE_RE.search(file_path)
                 if workflow_match:
                     workflows.add(workflow_match.group(1))
 
             # Check code-to-workflow mappings
-            for workflow_name, code_patterns in self.WORKFLOW_MAPPINGS.items():
-                for pattern in code_patterns:
-                    if pattern in file_path or file_path.startswith(pattern.rstrip('/')):
-                        workflows.add(workflow_name)
-                        break
+            workflows |= _workflows_for_path(file_path)
 
         return workflows
 
     def _update_workflow_file(
         self,
         workflow_file: Path,
-        workflow_name: str,
-        analysis: ChangeAnalysis
-    ) -> bool:
+        relevant_changes: List[str],
+        content: str
+    ) -> Optional[str]:
         """
-        Update a specific workflow file.
+        Compose the updated contents of a specific workflow file.
 
         Args:
             workflow_file: Path to the workflow file
-            workflow_name: Name of the workflow
-            analysis: The change analysis
+            relevant_changes: Changed files relevant to this workflow
+            content: Current file contents
 
         Returns:
-            True if file was updated
+            The new file contents, or None if the file needs no update
         """
-        try:
-            content = workflow_file.read_text(encoding='utf-8')
-
-            # Get relevant changes for this workflow
-            relevant_changes = self._get_relevant_changes(workflow_name, analysis)
-
-            if not relevant_changes:
-                return False
+        if not relevant_changes:
+            return None
 
+        try:
             # Update the last updated timestamp
             content = self._update_timestamp(content)
 
@@ -109,14 +134,11 @@ class WorkflowUpdater(BaseUpdater):
             content = self._update_dependencies(content, relevant_changes)
 
             # Add evolution note
-            content = self._add_evolution_note(content, relevant_changes)
-
-            workflow_file.write_text(content, encoding='utf-8')
-            return True
+            return self._add_evolution_note(content, relevant_changes)
 
         except Exception as e:
             print(f"Error updating workflow file {workflow_file}: {e}")
-            return False
+            return None
 
     def _get_relevant_changes(
         self,
@@ -124,37 +146,35 @@ class WorkflowUpdater(BaseUpdater):
         analysis: ChangeAnalysis
     ) -> List[str]:
         """Get changes relevant to a specific workflow."""
-        relevant = []
-
-        code_patterns = self.WORKFLOW_MAPPINGS.get(workflow_name, [])
-
-        for change in analysis.changes:
-            file_path = change.file_path
-
-            for pattern in code_patterns:
-                if pattern in file_path or file_path.startswith(pattern.rstrip('/')):
-                    relevant.append(file_path)
-                    break
-
-        return relevant
+        return [
+            change.file_path for change in analysis.changes
+            if workflow_name in _workflows_for_path(change.file_path)
+        ]
 
     def _update_timestamp(self, content: str) -> str:
         """Update the last updated timestamp."""
-        timestamp = datetime.now().strftime('%Y-%m-%d')
+        timestamp = self._timestamp('%Y-%m-%d')
+
+        # Fast path: a single "**Last Updated**: YYYY-MM-DD" stamp is patched in place
+        idx = content.find(_LAST_UPDATED)
+        if idx != -1:
+            start = idx + len(_LAST_UPDATED)
+            if (
+                _is_date(content[start:start + 10])
+                and content.find(_LAST_UPDATED, start) == -1
+            ):
+                return content[:start] + timestamp + content[start + 10:]
 
         # Look for existing last updated
-        if re.search(r'\*\*Last Updated\*\*:?', content, re.IGNORECASE):
-            content = re.sub(
-                r'(\*\*Last Updated\*\*:\s*)\d{4}-\d{2}-\d{2}',
-                rf'\g<1>{timestamp}',
-                content,
-                flags=re.IGNORECASE
-            )
+        if _LAST_UPDATED_RE.search(content):
+            content = _LAST_UPDATED_SUB.sub(rf'\g<1>{timestamp}', content)
         else:
             # Add at the beginning after title
-            title_match = re.search(r'^(# .+)$', content, re.MULTILINE)
-            if title_match:
-                insert_pos = title_match.end()
+            title_start = 0 if content.startswith("# ") else content.find("\n# ")
+            if title_start != -1:
+                insert_pos = content.find("\n", title_start + 1)
+                if insert_pos == -1:
+                    insert_pos = len(content)
                 content = (
                     content[:insert_pos] +
                     f"\n\n**Last Updated**: {timestamp}" +
@@ -169,21 +189,22 @@ class WorkflowUpdater(BaseUpdater):
             return content
 
         # Create dependencies section content
-        deps_content = "## Dependencies\n\nThis workflow depends on:\n\n"
-        for change in relevant_changes[:5]:  # Limit to 5
-            deps_content += f"- `{change}`\n"
+        lines = ["## Dependencies\n\nThis workflow depends on:\n\n"]
+        lines.extend([f"- `{change}`\n" for change in relevant_changes[:5]])  # Limit to 5
 
         if len(relevant_changes) > 5:
-            deps_content += f"- *and {len(relevant_changes) - 5} more files*\n"
-
-        if "## Dependencies" in content:
-            # Replace existing section
-            content = re.sub(
-                r'## Dependencies.*?\n(?=##|$)',
-                deps_content,
-                content,
-                flags=re.DOTALL
-            )
+            lines.append(f"- *and {len(relevant_changes) - 5} more files*\n")
+        deps_content = "".join(lines)
+
+        start = content.find("## Dependencies")
+        if start != -1:
+            # Replace existing section, up to the next header, by slicing
+            end = content.find("\n##", start)
+            if end != -1:
+                content = content[:start] + deps_content + content[end + 1:]
+            else:
+                # Section runs to the end of the file
+                content = _DEPS_RE.sub(deps_content, content)
         else:
             # Add before last section or at end
             last_section = content.rfind("\n## ")
@@ -196,7 +217,10 @@ class WorkflowUpdater(BaseUpdater):
 
     def _add_evolution_note(self, content: str, relevant_changes: List[str]) -> str:
         """Add an evolution note to track changes."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+        if _EVOLUTION_NOTE in content:
+            return content
+
+        timestamp = self._timestamp('%Y-%m-%d %H:%M')
 
         note = f"""
 
@@ -205,8 +229,48 @@ class WorkflowUpdater(BaseUpdater):
 *Evolution Note [{timestamp}]: Auto-updated due to changes in related code.*
 """
 
-        # Only add if not already present
-        if "*Evolution Note" not in content:
-            content = content.rstrip() + note
-
-        return content
+        return content.rstrip() + note
+
+
+def _build_workflow_scanner() -> Tuple[
+    re.Pattern, Dict[str, FrozenSet[str]], Tuple[Tuple[str, FrozenSet[str]], ...]
+]:
+    """
+    Build an inverted index over WORKFLOW_MAPPINGS.
+
+    Patterns are tried longest first inside a lookahead so every position is
+    checked; each pattern maps to the workflows of every pattern it contains,
+    so one pass finds all substring matches. Directory patterns also match as
+    bare prefixes (e.g. 'frontend/' matches any path starting 'frontend').
+    """
+    pattern_to_workflows: Dict[str, Set[str]] = {}
+    for workflow_name, code_patterns in WorkflowUpdater.WORKFLOW_MAPPINGS.items():
+        for pattern in code_patterns:
+            pattern_to_workflows.setdefault(pattern, set()).add(workflow_name)
+
+    keys = sorted(pattern_to_workflows, key=len, reverse=True)
+    scanner = re.compile('(?=(' + '|'.join(re.escape(k) for k in keys) + '))')
+    implied = {
+        key: frozenset().union(*(pattern_to_workflows[k] for k in keys if k in key))
+        for key in keys
+    }
+    prefixes = tuple(
+        (key.rstrip('/'), frozenset(pattern_to_workflows[key]))
+        for key in keys if key.endswith('/')
+    )
+    return scanner, implied, prefixes
+
+
+_PATTERN_RE, _PATTERN_TO_WORKFLOWS, _PREFIX_TO_WORKFLOWS = _build_workflow_scanner()
+
+
+@lru_cache(maxsize=4096)
+def _workflows_for_path(file_path: str) -> FrozenSet[str]:
+    """Return every workflow whose code patterns match the path."""
+    workflows: Set[str] = set()
+    for match in _PATTERN_RE.finditer(file_path):
+        workflows |= _PATTERN_TO_WORKFLOWS[match.group(1)]
+    for prefix, prefix_workflows in _PREFIX_TO_WORKFLOWS:
+        if file_path.startswith(prefix):
+            workflows |= prefix_workflows
+    return frozenset(workflows)
@@ -23,6 +23,7 @@ Examples:
 import argparse
 import os
 import platform
+import re
 import subprocess
 import sys
 import time
@@ -38,26 +39,9 @@ FRONTEND_PORT = 3000
 
 def log(msg: str, level: str = "info"):
     """Print formatted log messages."""
-    # Disable colors on Windows unless ANSICON or similar is present
-    use_colors = not is_windows() or os.environ.get("ANSICON") or os.environ.get("TERM")
-    
-    colors = {
-        "info": "\033[36m" if use_colors else "",     # Cyan
-        "success": "\033[32m" if use_colors else "",  # Green
-        "warning": "\033[33m" if use_colors else "",  # Yellow
-        "error": "\033[31m" if use_colors else "",    # Red
-        "header": "\033[35m" if use_colors else "",   # Magenta
-    }
-    reset = "\033[0m" if use_colors else ""
-    color = colors.get(level, "")
-    prefix = {
-        "info": "[INFO]",
-        "success": "[OK]",
-        "warning": "[WARN]",
-        "error": "[ERROR]",
-        "header": "[GHOST]",
-    }.get(level, "[INFO]")
-    print(f"{color}{prefix} {msg}{reset}")
+    color = _COLORS.get(level, "")
+    prefix = _PREFIXES.get(level, "[INFO]")
+    print(f"{color}{prefix} {msg}{_RESET}")
 
 
 def run_command(cmd: list[str], cwd: Path = None, check: bool = False) -> subprocess.CompletedProcess:
@@ -81,34 +65,72 @@ def is_windows() -> bool:
     return platform.system() == "Windows"
 
 
-def check_port(port: int) -> int | None:
-    """Check if a port is in use and return the process ID if it is."""
+# Disable colors on Windows unless ANSICON or similar is present
+_USE_COLORS = not is_windows() or bool(os.environ.get("ANSICON") or os.environ.get("TERM"))
+_COLORS = {
+    "info": "\033[36m",     # Cyan
+    "success": "\033[32m",  # Green
+    "warning": "\033[33m",  # Yellow
+    "error": "\033[31m",    # Red
+    "header": "\033[35m",   # Magenta
+} if _USE_COLORS else {}
+_RESET = "\033[0m" if _USE_COLORS else ""
+_PREFIXES = {
+    "info": "[INFO]",
+    "success": "[OK]",
+    "warning": "[WARN]",
+    "error": "[ERROR]",
+    "header": "[GHOST]",
+}
+
+
+# netstat -ano row for a listening socket: local address, foreign address, state, PID
+_NETSTAT_LISTEN_RE = re.compile(r':(\d+)\s+\S+\s+LISTENING\s+(\d+)')
+
+
+def check_ports(ports: list[int]) -> dict[int, int | None]:
+    """Check several ports with one netstat/lsof call and map each to its PID (or None)."""
+    pids: dict[int, int | None] = dict.fromkeys(ports)
     try:
         if is_windows():
-            # Windows: use netstat with shell=True for pipe support
+            # Windows: one netstat listing covers every port; no cmd.exe needed
             result = subprocess.run(
-                f"netstat -ano | findstr :{port}",
+                ["netstat", "-ano"],
                 capture_output=True,
-                text=True,
-                shell=True
+                text=True
             )
             if result.returncode == 0 and result.stdout:
-                for line in result.stdout.strip().split("\n"):
-                    if f":{port}" in line and "LISTENING" in line:
-                        parts = line.strip().split()
-                        if len(parts) >= 5:
-                            try:
-                                return int(parts[-1])
-                            except ValueError:
-                                continue
+                for match in _NETSTAT_LISTEN_RE.finditer(result.stdout):
+                    port = int(match.group(1))
+                    if port in pids and pids[port] is None:
+                        pids[port] = int(match.group(2))
         else:
-            # Unix: use lsof or netstat
-            result = run_command(["lsof", "-ti", f":{port}"])
-            if result.returncode == 0 and result.stdout.strip():
-                return int(result.stdout.strip().split("\n")[0])
+            # Unix: one lsof call with an -i filter per port, in field output (p=PID, n=name)
+            cmd = ["lsof", "-nP", "-Fpn"]
+            for port in ports:
+                cmd += ["-i", f":{port}"]
+            result = run_command(cmd)
+            # lsof exits 1 when any one filter matches nothing, so read the output regardless
+            if result.stdout.strip():
+                pid = None
+                for line in result.stdout.splitlines():
+                    if line.startswith("p"):
+                        pid = int(line[1:])
+                    elif line.startswith("n") and pid is not None:
+                        local = line[1:].split("->")[0]
+                        port_str = local.rpartition(":")[2]
+                        if port_str.isdigit():
+                            port = int(port_str)
+                            if port in pids and pids[port] is None:
+                                pids[port] = pid
     except Exception as e:
-        log(f"Could not check port {port}: {e}", "warning")
-    return None
+        log(f"Could not check ports {ports}: {e}", "warning")
+    return pids
+
+
+def check_port(port: int) -> int | None:
+    """Check if a port is in use and return the process ID if it is."""
+    return check_ports([port])[port]
 
 
 def kill_process(pid: int) -> bool:
@@ -125,16 +147,17 @@ def kill_process(pid: int) -> bool:
         return False
 
 
-def clear_port(port: int) -> bool:
-    """Clear a port by killing the process using it."""
-    pid = check_port(port)
-    if pid:
-        log(f"Port {port} is in use by PID {pid}. Attempting to free it...", "warning")
-        if kill_process(pid):
-            log(f"Freed port {port}", "success")
-            return True
-        return False
-    return True
+def clear_ports(ports: list[int]) -> list[int]:
+    """Clear ports by killing the processes using them; return the ports that stay busy."""
+    busy = []
+    for port, pid in check_ports(ports).items():
+        if pid:
+            log(f"Port {port} is in use by PID {pid}. Attempting to free it...", "warning")
+            if kill_process(pid):
+                log(f"Freed port {port}", "success")
+            else:
+                busy.append(port)
+    return busy
 
 
 def check_python_deps() -> bool:
@@ -189,8 +212,9 @@ def status():
     log("Checking system status...", "header")
     
     # Check ports
-    engine_pid = check_port(ENGINE_PORT)
-    frontend_pid = check_port(FRONTEND_PORT)
+    pids = check_ports([ENGINE_PORT, FRONTEND_PORT])
+    engine_pid = pids[ENGINE_PORT]
+    frontend_pid = pids[FRONTEND_PORT]
     
     print(f"\n{'Service':<20} {'Port':<10} {'Status':<15} {'PID':<10}")
     print("-" * 60)
@@ -223,8 +247,7 @@ def stop():
         log("PM2 processes stopped", "success")
     
     # Clear ports
-    for port in [ENGINE_PORT, FRONTEND_PORT]:
-        pid = check_port(port)
+    for port, pid in check_ports([ENGINE_PORT, FRONTEND_PORT]).items():
         if pid:
             log(f"Stopping process on port {port} (PID {pid})...")
             kill_process(pid)
@@ -245,10 +268,9 @@ def dev():
     
     # Clear ports
     log("Checking ports...")
-    for port in [ENGINE_PORT, FRONTEND_PORT]:
-        if not clear_port(port):
-            log(f"Could not free port {port}. Please stop the conflicting process manually.", "error")
-            return
+    for port in clear_ports([ENGINE_PORT, FRONTEND_PORT]):
+        log(f"Could not free port {port}. Please stop the conflicting process manually.", "error")
+        return
     
     log("Starting services...")
     log(f"Frontend will be available at: http://localhost:{FRONTEND_PORT}", "info")
@@ -310,8 +332,7 @@ def prod():
         return
     
     # Clear ports
-    for port in [ENGINE_PORT, FRONTEND_PORT]:
-        clear_port(port)
+    clear_ports([ENGINE_PORT, FRONTEND_PORT])
     
     # Start with PM2
     log("Starting services with PM2...")
@@ -1,10 +1,15 @@
 
 import asyncio
+import logging
 import os
 import sqlite3
+import threading
+import time
 import uuid
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+logger = logging.getLogger(__name__)
 
 # Mocking the minimal classes needed
 class MarketData(BaseModel):
@@ -17,7 +22,7 @@ class MarketData(BaseModel):
     expiration: str = ""
 
 class Opportunity(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     ticker: str
     market_data: MarketData
     priority: int = 0
@@ -28,44 +33,60 @@ class PersistentQueue:
         self.db_path = db_path
         self.table_name = table_name
         self.model_cls = model_cls
+        # Bound once: the model's JSON serializer, straight to bytes
+        self._to_json = TypeAdapter(model_cls).dump_json
+        # One shared connection (autocommit, WAL) instead of connect/close per op;
+        # the lock serializes access since pop() runs in a worker thread
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._lock = threading.Lock()
         self._init_db()
 
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} (id TEXT PRIMARY KEY, priority INTEGER, timestamp REAL, payload TEXT, status TEXT)")
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} (id TEXT PRIMARY KEY, priority INTEGER, timestamp REAL, payload BLOB, status TEXT)")
+            # Partial index over queued rows only, in pop order
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_queued ON {self.table_name} (priority DESC, timestamp ASC) WHERE status='QUEUED'")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
 
     async def push(self, item, priority=0):
-        # simplified push
-        conn = sqlite3.connect(self.db_path)
-        payload = item.model_dump_json()
-        item_id = item.id
-        ts = datetime.now().timestamp()
-        conn.execute(f"INSERT OR REPLACE INTO {self.table_name} VALUES (?, ?, ?, ?, 'QUEUED')", (item_id, priority, ts, payload))
-        conn.commit()
-        conn.close()
+        # simplified push; thin wrapper kept for compatibility
+        await self.push_batch([(item, priority)])
+
+    async def push_batch(self, items):
+        # items: list of (item, priority); all rows land in one transaction
+        ts = time.time()
+        to_json = self._to_json
+        rows = [(item.id, priority, ts, to_json(item)) for item, priority in items]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(f"INSERT OR REPLACE INTO {self.table_name} VALUES (?, ?, ?, ?, 'QUEUED')", rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
     async def pop(self):
         return await asyncio.to_thread(self._pop_sync)
 
     def _pop_sync(self):
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute(f"SELECT id, payload FROM {self.table_name} WHERE status='QUEUED' LIMIT 1")
-            row = cursor.fetchone()
-            if row:
-                item_id, payload = row
-                print(f"[DEBUG] Popped item {item_id}. Deleting...")
-                cursor.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (item_id,))
-                conn.commit()
-                print(f"[DEBUG] Deleted item {item_id}.")
-                return self.model_cls.model_validate_json(payload)
-            return None
-        finally:
-            conn.close()
+        # Select and delete in one statement (SQLite >= 3.35)
+        with self._lock:
+            rows = self._conn.execute(
+                f"DELETE FROM {self.table_name} WHERE id = (SELECT id FROM {self.table_name} WHERE status='QUEUED' ORDER BY priority DESC, timestamp ASC LIMIT 1) RETURNING id, payload"
+            ).fetchall()
+        if rows:
+            item_id, payload = rows[0]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Popped and deleted item %s.", item_id)
+            return self.model_cls.model_validate_json(payload)
+        return None
 
 async def run_test():
     db_file = "test_queue.db"
@@ -91,8 +112,11 @@ async def run_test():
         
         # Simulate processing failure (no-op, just next loop)
         
-    if os.path.exists(db_file):
-        os.remove(db_file)
+    queue.close()
+    for path in (db_file, f"{db_file}-wal", f"{db_file}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if os.getenv("REPRO_DEBUG") == "1" else logging.INFO)
     asyncio.run(run_test())
@@ -1,13 +1,18 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 url = "http://localhost:3002/api/auth/login"
 payload = {"password": "", "mode": "demo"}
 headers = {"Content-Type": "application/json"}
 
+# One keep-alive pool for every request to the engine
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 try:
     print(f"Sending request to {url}...")
-    response = requests.post(url, json=payload, headers=headers, timeout=5)
+    response = session.post(url, json=payload, headers=headers, timeout=(2, 5))
     print(f"Status Code: {response.status_code}")
     print(f"Response Body: {response.text}")
 except Exception as e:
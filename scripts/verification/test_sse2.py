@@ -30,26 +30,28 @@ async def test_sse():
             print("Reading events (10 seconds)...")
             print("-" * 50)
 
-            async for line in resp.content:
-                current = asyncio.get_event_loop().time()
-                if current - start > 10:
+            loop_time = asyncio.get_event_loop().time
+            deadline = start + 10
+            while True:
+                # One SSE record ("data: ...\n\n") per read
+                record = await resp.content.readuntil(b"\n\n")
+                if not record:
+                    break
+                if loop_time() > deadline:
                     print("Timeout reached")
                     break
 
-                try:
-                    line_str = line.decode().strip()
-                    if line_str:
-                        if line_str.startswith("data: "):
-                            data = line_str[6:]
-                            try:
-                                event = json.loads(data)
-                                events_received += 1
-                                print(f"\nEvent {events_received}:")
-                                print(json.dumps(event, indent=2))
-                            except json.JSONDecodeError:
-                                print(f"Raw data: {data}")
-                except Exception as e:
-                    print(f"Error reading line: {e}")
+                for line in record.split(b"\n"):
+                    if not line.startswith(b"data: "):
+                        continue
+                    data = line[6:]
+                    try:
+                        event = json.loads(data)
+                        events_received += 1
+                        print(f"\nEvent {events_received}:")
+                        print(json.dumps(event, indent=2))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        print(f"Raw data: {data.decode(errors='replace')}")
 
             print(f"\nTotal events received: {events_received}")
 
@@ -1,6 +1,7 @@
 
 import asyncio
 import unittest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from engine.agents.brain import BrainAgent
 from engine.core.synapse import Synapse
@@ -9,8 +10,11 @@ from engine.core.bus import EventBus, Message
 class TestCancelLogic(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.bus = AsyncMock(spec=EventBus)
-        self.synapse = AsyncMock(spec=Synapse)
-        self.synapse.opportunities = AsyncMock()
+        self.synapse = MagicMock(spec=Synapse)
+        # Only the queue methods are used; skip building a full AsyncMock tree
+        self.synapse.opportunities = SimpleNamespace(
+            pop=AsyncMock(side_effect=[None]), push=AsyncMock(), size=AsyncMock(return_value=0)
+        )
         self.brain = BrainAgent(3, self.bus, synapse=self.synapse)
         self.brain.log = AsyncMock()
 
@@ -30,12 +34,18 @@ class TestCancelLogic(unittest.IsolatedAsyncioTestCase):
         # This should return immediately because stop_requested is True (or set during loop)
         # We need to rely on the fact that if it DOESN'T check, it might loop if we fed it infinite items.
         # But here we just want to see the log message "Brain loop stopped..."
+        loop_stopped = asyncio.Event()
+
+        async def capture(message, *args, **kwargs):
+            if "Brain loop stopped" in message:
+                loop_stopped.set()
+
+        self.brain.log = AsyncMock(side_effect=capture)
         
         await self.brain.process_opportunities(None)
         
         # Check logs
-        stop_logs = [call for call in self.brain.log.call_args_list if "Brain loop stopped" in str(call)]
-        self.assertTrue(len(stop_logs) > 0, "Brain should have logged stop message")
+        self.assertTrue(loop_stopped.is_set(), "Brain should have logged stop message")
 
 if __name__ == "__main__":
     unittest.main()
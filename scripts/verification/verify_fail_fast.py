@@ -1,7 +1,6 @@
 
-import asyncio
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from engine.main import GhostEngine
 from engine.core.bus import Message
 
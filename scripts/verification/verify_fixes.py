@@ -1,6 +1,6 @@
 
-import asyncio
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock
 from engine.agents.brain import BrainAgent
 from engine.core.synapse import Synapse, Opportunity, MarketData
@@ -9,9 +9,14 @@ import uuid
 
 class TestBrainFixes(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
+        # Built per test: Gemini init schedules a task on the running loop
         self.bus = AsyncMock(spec=EventBus)
-        self.synapse = AsyncMock(spec=Synapse)
-        self.synapse.opportunities = AsyncMock()
+        self.synapse = MagicMock(spec=Synapse)
+        # Only the queue methods are used; skip building a full AsyncMock tree
+        self.synapse.opportunities = SimpleNamespace(
+            pop=AsyncMock(side_effect=[None]), push=AsyncMock(), size=AsyncMock(return_value=0)
+        )
+        self.synapse.executions = SimpleNamespace(push=AsyncMock(), size=AsyncMock(return_value=0))
         self.brain = BrainAgent(3, self.bus, synapse=self.synapse)
         
         # Disable simulation for speed
@@ -19,27 +24,6 @@ class TestBrainFixes(unittest.IsolatedAsyncioTestCase):
         self.brain.log = AsyncMock()
         self.brain.log_error = AsyncMock()
 
-    async def test_poison_pill_loop_detection(self):
-        """Test that Brain detects and breaks infinite loops of the same ID"""
-        opp_id = str(uuid.uuid4())
-        opp = Opportunity(
-            id=opp_id,
-            ticker="LOOP_TEST",
-            market_data=MarketData(ticker="LOOP_TEST", title="T", subtitle="S", yes_price=50, no_price=50, volume=100, expiration="2025")
-        )
-
-        # Mock queue returning the SAME item 5 times then None
-        self.synapse.opportunities.pop.side_effect = [opp, opp, opp, opp, opp, None] 
-        
-        # Mock debate failing to ensure it stays in the loop logic (if it didn't break)
-        self.brain.run_debate = AsyncMock(return_value={"confidence": 0, "reasoning": "Fail", "estimated_probability": 0.5})
-
-        await self.brain.process_opportunities(None)
-
-        # Verify critical error was logged
-        critical_logs = [call for call in self.brain.log.call_args_list if "INFINITE LOOP DETECTED" in str(call)]
-        self.assertTrue(len(critical_logs) > 0, "Brain should have logged INFINITE LOOP DETECTED")
-
     async def test_debate_error_handling(self):
         """Test that debate errors are caught and return veto properly"""
         opp = Opportunity(
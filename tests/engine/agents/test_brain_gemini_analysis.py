@@ -1,10 +1,9 @@
 import pytest
 import os
 from engine.agents.brain import BrainAgent
-from engine.core.synapse import Opportunity, MarketData
 
 @pytest.mark.asyncio
-async def test_brain_real_gemini_analysis(bus, synapse):
+async def test_brain_real_gemini_analysis(bus, synapse, make_opp):
     """Verify BrainAgent performs a real AI analysis and produces a signal."""
     brain = BrainAgent(3, bus, synapse=synapse)
     brain.CONFIDENCE_THRESHOLD = 0.5  # Lower for test
@@ -15,16 +14,11 @@ async def test_brain_real_gemini_analysis(bus, synapse):
         pytest.skip("Gemini API key not configured - set GEMINI_API_KEY env var")
 
     # 1. Manually push an opportunity to Synapse
-    md = MarketData(
-        ticker="TEST-BRAIN-AI",
+    opp = make_opp(
+        "TEST-BRAIN-AI",
         title="Will Gemini pass this test?",
-        subtitle="AI validation",
-        yes_price=50,
-        no_price=50,
-        volume=100,
-        expiration="2026-12-31"
+        subtitle="AI validation"
     )
-    opp = Opportunity(ticker="TEST-BRAIN-AI", market_data=md)
     await synapse.opportunities.push(opp)
 
     # 2. Run Brain's consumption logic once
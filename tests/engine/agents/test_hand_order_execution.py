@@ -1,27 +1,29 @@
+import asyncio
 import pytest
 from engine.agents.hand import HandAgent
-from engine.core.synapse import Opportunity, MarketData, ExecutionSignal
+from engine.core.synapse import ExecutionSignal
 from unittest.mock import patch
 
-@pytest.mark.asyncio
-async def test_hand_real_demo_execution(bus, synapse, k_client, vault):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_hand_real_demo_execution(bus, synapse, kalshi_warm, vault):
     """Verify HandAgent executes a real order on Kalshi Demo."""
     # WARNING: This test PLACES AN ACTUAL ORDER on Kalshi Demo.
-    hand = HandAgent(4, bus, vault=vault, kalshi_client=k_client, synapse=synapse)
+    hand = HandAgent(4, bus, vault=vault, kalshi_client=kalshi_warm, synapse=synapse)
     
     # Mock snipe_check to always pass
     with patch.object(HandAgent, 'snipe_check', return_value={"valid": True, "entry_price": 50, "slippage": 0}):
-        # Ensure vault has funds
-        await vault.initialize(100000) # $1000
-        
         # 1. Create a dummy execution signal for a real but cheap market
         # We'll try to find a real ticker first or use a known one.
         # For now, let's use a VERY safe small order.
         
         # To be extremely safe, we should fetch a real ticker first
         from engine.agents.senses import SensesAgent
-        senses = SensesAgent(2, bus, kalshi_client=k_client, synapse=synapse)
-        await senses.surveillance_loop()
+        senses = SensesAgent(2, bus, kalshi_client=kalshi_warm, synapse=synapse)
+
+        # Fund the vault ($1000) while the market scan is in flight
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(vault.initialize(100000))
+            tg.create_task(senses.surveillance_loop())
         
         opp = await synapse.opportunities.pop()
         if not opp:
@@ -48,5 +50,3 @@ async def test_hand_real_demo_execution(bus, synapse, k_client, vault):
         # Vault balance will decrease if order filled
         assert vault.current_balance < 100000
         print(f"\n[HAND] Execution success. New Balance: ${vault.current_balance/100:.2f}")
-
-import asyncio
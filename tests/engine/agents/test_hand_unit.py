@@ -6,7 +6,6 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from agents.hand import HandAgent
-from core.vault import RecursiveVault
 
 
 @pytest.fixture
@@ -17,17 +16,25 @@ def mock_bus():
     return bus
 
 
+class VaultStub:
+    """Plain-attribute stand-in for RecursiveVault; no spec checks on access."""
+
+    HARD_FLOOR_CENTS = 25500  # $255.00, as in RecursiveVault
+
+    def __init__(self):
+        self.current_balance = 50000  # $500
+        self.kill_switch_active = False
+        self.get_available_balance = MagicMock(return_value=50000)
+        self.reserve_funds = MagicMock(return_value=True)
+        self.confirm_reservation = MagicMock()
+        self.release_reservation = MagicMock()
+        self.lock_principal = MagicMock()
+
+
 @pytest.fixture
 def mock_vault():
     """Create an initialized mock vault."""
-    vault = MagicMock(spec=RecursiveVault)
-    vault.current_balance = 50000  # $500
-    vault.get_available_balance.return_value = 50000
-    vault.kill_switch_active = False
-    vault.reserve_funds.return_value = True
-    vault.confirm_reservation = MagicMock()
-    vault.release_reservation = MagicMock()
-    return vault
+    return VaultStub()
 
 
 @pytest.fixture
@@ -48,73 +55,37 @@ class TestPreTradeValidation:
     """Test pre-trade validation logic."""
 
     @pytest.mark.asyncio
-    async def test_rejects_when_kill_switch_active(self, hand_agent, mock_vault):
-        """Order rejected when kill switch is active."""
-        mock_vault.kill_switch_active = True
-
-        result = await hand_agent.execute_order("KXWIN-2024-001", 50, 1000)
-
+    @pytest.mark.parametrize("ticker,price,stake,expected", [
+        ("", 50, 1000, "ticker"),                # invalid ticker format
+        ("KXWIN-2024-001", 0, 1000, "price"),    # price below 1 cent
+        ("KXWIN-2024-001", 100, 1000, "price"),  # price above 99 cents
+        ("KXWIN-2024-001", 50, 0, "stake"),      # zero stake
+        ("KXWIN-2024-001", 50, -100, ""),        # negative stake
+        ("KXWIN-2024-001", 50, 8000, "max"),     # stake above $75 maximum
+    ])
+    async def test_rejects_invalid_order(self, hand_agent, ticker, price, stake, expected):
+        """Order rejected when its arguments fail validation."""
+        result = await hand_agent.execute_order(ticker, price, stake)
         assert result["success"] is False
-        assert "kill switch" in result["error"].lower()
+        assert expected in result["error"].lower()
 
     @pytest.mark.asyncio
-    async def test_rejects_invalid_ticker(self, hand_agent):
-        """Order rejected with invalid ticker format."""
-        result = await hand_agent.execute_order("", 50, 1000)
-        assert result["success"] is False
-        assert "ticker" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_rejects_price_below_1_cent(self, hand_agent):
-        """Order rejected when price is below 1 cent."""
-        result = await hand_agent.execute_order("KXWIN-2024-001", 0, 1000)
-        assert result["success"] is False
-        assert "price" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_rejects_price_above_99_cents(self, hand_agent):
-        """Order rejected when price is above 99 cents."""
-        result = await hand_agent.execute_order("KXWIN-2024-001", 100, 1000)
-        assert result["success"] is False
-        assert "price" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_rejects_zero_stake(self, hand_agent):
-        """Order rejected with zero stake."""
-        result = await hand_agent.execute_order("KXWIN-2024-001", 50, 0)
-        assert result["success"] is False
-        assert "stake" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_rejects_negative_stake(self, hand_agent):
-        """Order rejected with negative stake."""
-        result = await hand_agent.execute_order("KXWIN-2024-001", 50, -100)
-        assert result["success"] is False
-
-    @pytest.mark.asyncio
-    async def test_rejects_stake_above_maximum(self, hand_agent):
-        """Order rejected when stake exceeds $75 maximum."""
-        result = await hand_agent.execute_order("KXWIN-2024-001", 50, 8000)  # $80
-        assert result["success"] is False
-        assert "max" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_rejects_insufficient_funds(self, hand_agent, mock_vault):
-        """Order rejected when available balance is insufficient."""
-        mock_vault.get_available_balance.return_value = 500  # $5
-
-        result = await hand_agent.execute_order("KXWIN-2024-001", 50, 1000)  # $10
-        assert result["success"] is False
-        assert "insufficient" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_rejects_below_hard_floor(self, hand_agent, mock_vault):
-        """Order rejected when balance below $255 hard floor."""
-        mock_vault.current_balance = 25000  # $250
+    @pytest.mark.parametrize("kill_switch,available,balance,expected", [
+        (True, 50000, 50000, "kill switch"),     # kill switch active
+        (False, 500, 50000, "insufficient"),     # $5 available for a $10 order
+        (False, 50000, 25000, "hard floor"),     # $250 balance below $255 floor
+    ])
+    async def test_rejects_on_vault_state(
+        self, hand_agent, mock_vault, kill_switch, available, balance, expected
+    ):
+        """Order rejected when the vault state forbids trading."""
+        mock_vault.kill_switch_active = kill_switch
+        mock_vault.get_available_balance.return_value = available
+        mock_vault.current_balance = balance
 
         result = await hand_agent.execute_order("KXWIN-2024-001", 50, 1000)
         assert result["success"] is False
-        assert "hard floor" in result["error"].lower()
+        assert expected in result["error"].lower()
 
 
 class TestOrderExecution:
@@ -161,15 +132,18 @@ class TestOrderExecution:
 class TestKellyCriterion:
     """Test Kelly criterion stake calculation."""
 
-    def test_zero_ev_returns_zero_stake(self, hand_agent):
-        """Zero or negative EV returns zero stake."""
-        stake = hand_agent.calculate_kelly_stake(confidence=0.6, ev=0)
-        assert stake == 0
+    @pytest.mark.parametrize("balance", [10000, 1000000])  # $100, $10,000
+    @pytest.mark.parametrize("confidence", [0.5, 0.6, 0.9, 0.99])
+    @pytest.mark.parametrize("ev", [-1.0, -0.1, 0, 0.1, 0.5, 1.0])
+    def test_stake_invariants(self, hand_agent, mock_vault, balance, confidence, ev):
+        """Stake is zero without positive EV and never exceeds MAX_STAKE_CENTS."""
+        mock_vault.current_balance = balance
 
-    def test_negative_ev_returns_zero_stake(self, hand_agent):
-        """Negative EV returns zero stake."""
-        stake = hand_agent.calculate_kelly_stake(confidence=0.6, ev=-0.1)
-        assert stake == 0
+        stake = hand_agent.calculate_kelly_stake(confidence=confidence, ev=ev)
+
+        assert 0 <= stake <= hand_agent.MAX_STAKE_CENTS
+        if ev <= 0:
+            assert stake == 0
 
     def test_high_confidence_higher_stake(self, hand_agent, mock_vault):
         """Higher confidence leads to higher stake."""
@@ -181,14 +155,6 @@ class TestKellyCriterion:
 
         assert high_conf_stake > low_conf_stake
 
-    def test_stake_capped_at_max(self, hand_agent, mock_vault):
-        """Stake never exceeds MAX_STAKE_CENTS."""
-        mock_vault.current_balance = 1000000  # $10,000
-
-        stake = hand_agent.calculate_kelly_stake(confidence=0.99, ev=0.5)
-
-        assert stake <= hand_agent.MAX_STAKE_CENTS
-
 
 class TestSnipeCheck:
     """Test snipe check logic."""
@@ -1,10 +1,10 @@
 import pytest
 from engine.agents.senses import SensesAgent
 
-@pytest.mark.asyncio
-async def test_senses_real_market_ingestion(bus, synapse, k_client):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_senses_real_market_ingestion(bus, synapse, kalshi_warm):
     """Verify SensesAgent can fetch real markets and push to Synapse."""
-    senses = SensesAgent(2, bus, kalshi_client=k_client, synapse=synapse)
+    senses = SensesAgent(2, bus, kalshi_client=kalshi_warm, synapse=synapse)
     
     # Run the internal fetch logic once
     # SensesAgent.surveillance_loop() is the method
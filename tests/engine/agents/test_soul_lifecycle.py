@@ -11,20 +11,36 @@ async def test_soul_initialization_state(bus, synapse, vault):
     assert soul.autopilot_enabled is False
     assert soul.is_locked_down is False
 
+def _signal_system_control(soul):
+    """Wrap the Soul's SYSTEM_CONTROL handler so each handled message sets an event."""
+    handled = asyncio.Event()
+    original = soul.on_system_control
+
+    async def instrumented(message):
+        try:
+            await original(message)
+        finally:
+            handled.set()
+
+    soul.on_system_control = instrumented
+    return handled
+
 @pytest.mark.asyncio
 async def test_soul_autopilot_toggle(bus, synapse, vault):
     """Verify Soul agent responds to START/STOP_AUTOPILOT messages."""
     soul = SoulAgent(1, bus, vault=vault, synapse=synapse)
+    handled = _signal_system_control(soul)
     await soul.start()
     
     # 1. Start Autopilot
     await bus.publish("SYSTEM_CONTROL", {"action": "START_AUTOPILOT", "isPaperTrading": True}, "TEST")
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(handled.wait(), 1.0)
+    handled.clear()
     assert soul.autopilot_enabled is True
     
     # 2. Stop Autopilot
     await bus.publish("SYSTEM_CONTROL", {"action": "STOP_AUTOPILOT"}, "TEST")
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(handled.wait(), 1.0)
     assert soul.autopilot_enabled is False
     
     await soul.teardown()
@@ -1,42 +1,58 @@
 import os
 import sys
+import uuid
 import pytest
-import asyncio
 import sqlite3
 import pytest_asyncio
+from datetime import datetime
 from dotenv import load_dotenv
 
 # Ensure we are loading the engine environment
 engine_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../engine"))
-sys.path.append(engine_path)
+# Appended (not inserted) so the engine dir never shadows earlier entries;
+# guarded so re-importing conftest does not grow sys.path
+if engine_path not in sys.path:
+    sys.path.append(engine_path)
 load_dotenv(os.path.join(engine_path, ".env"))
 
 from engine.core.bus import EventBus
-from engine.core.synapse import Synapse
+from engine.core.synapse import Synapse, Opportunity, MarketData
 from engine.core.network import kalshi_client
 from engine.core.vault import RecursiveVault
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create a session-scoped event loop."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def pytest_configure(config):
+    """Pin paper-trading mode once for the whole run; tests never touch production."""
+    os.environ["IS_PRODUCTION"] = "false"
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_display():
+    """Build the GhostDisplay singleton up front so no single test pays for it."""
+    from core.display import get_display
+    get_display()
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None and sys.platform != "win32":
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run every pytest-asyncio loop on uvloop when it is installed."""
+        return uvloop.EventLoopPolicy()
 
 @pytest_asyncio.fixture(scope="function")
-async def test_db():
+async def test_db(tmp_path):
     """Create a temporary SQLite database for testing isolation."""
-    db_path = "test_ghost_memory.db"
-    if os.path.exists(db_path):
-        os.remove(db_path)
-    
-    yield db_path
-    
-    if os.path.exists(db_path):
-        try:
-            os.remove(db_path)
-        except PermissionError:
-            pass # DB might still be locking on some systems
+    db_path = str(tmp_path / "test_ghost_memory.db")
+
+    # WAL is persistent in the file, so every per-op connection Synapse opens
+    # commits with one WAL fsync instead of journal + database fsyncs
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.close()
+
+    return db_path
 
 @pytest_asyncio.fixture(scope="function")
 async def bus():
@@ -54,12 +70,45 @@ async def vault(test_db):
     await v.initialize(100000)  # $1000
     yield v
 
-@pytest_asyncio.fixture(scope="function")
+@pytest.fixture(scope="session")
+def opp_template():
+    """Opportunity validated once per session; make_opp copies it."""
+    return Opportunity(
+        ticker="TPL",
+        market_data=MarketData(
+            ticker="TPL", title="T", subtitle="S",
+            yes_price=50, no_price=50, volume=100, expiration="2026-12-31"
+        )
+    )
+
+@pytest.fixture
+def make_opp(opp_template):
+    """
+    Build Opportunity objects from the session template.
+
+    model_copy skips validation; each copy gets its own id and timestamp.
+    Extra keyword arguments override MarketData fields.
+    """
+    def _make(ticker="X", **market_fields):
+        md = opp_template.market_data.model_copy(update={"ticker": ticker, **market_fields})
+        return opp_template.model_copy(update={
+            "id": str(uuid.uuid4()),
+            "ticker": ticker,
+            "market_data": md,
+            "timestamp": datetime.now(),
+        })
+    return _make
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def k_client():
-    """Real Kalshi client authenticated with Demo credentials from .env."""
-    # Ensure we ARE in paper trading mode for safety
-    os.environ["IS_PRODUCTION"] = "false"
-    
+    """
+    Real Kalshi client authenticated with Demo credentials from .env.
+
+    Session-scoped: the client is an engine singleton, so the auth probe
+    only needs to run once per test session. The probe opens the client's
+    aiohttp session on the session loop, so tests taking this fixture must
+    run there too: mark them @pytest.mark.asyncio(loop_scope="session").
+    """
     # Check if we have credentials
     if not os.getenv("KALSHI_DEMO_KEY_ID") or not os.getenv("KALSHI_DEMO_PRIVATE_KEY"):
         pytest.skip("Kalshi Demo credentials not found in engine/.env")
@@ -75,3 +124,19 @@ async def k_client():
     yield kalshi_client
     # We don't close the client here as it might be used by other tests 
     # and it's a singleton in the engine.
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def kalshi_warm(k_client):
+    """
+    Kalshi client with a primed connection pool.
+
+    Issues one cheap market request so the TLS handshake to the market
+    endpoints is paid once per session rather than inside the first
+    surveillance_loop() under test. The pool lives on the session loop,
+    so consuming tests must be marked @pytest.mark.asyncio(loop_scope="session").
+    """
+    try:
+        await k_client.get_active_markets(limit=1)
+    except Exception as e:
+        pytest.fail(f"Failed to warm Kalshi connection pool: {e}")
+    return k_client
@@ -5,8 +5,8 @@ from engine.core.network import kalshi_client
 @pytest.mark.asyncio
 async def test_kalshi_auth_demo():
     """Verify that we can authenticate with Kalshi Demo using credentials in .env."""
-    # Ensure IS_PRODUCTION is false
-    os.environ["IS_PRODUCTION"] = "false"
+    # Paper trading mode is pinned by pytest_configure in conftest.py
+    assert os.environ["IS_PRODUCTION"] == "false"
     
     # Check credentials existence
     assert os.getenv("KALSHI_DEMO_KEY_ID") is not None
@@ -14,7 +14,7 @@ async def test_error_dispatcher_persistence(synapse):
     )
     
     # Wait for non-blocking Synapse push
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(dispatcher.wait_for_flush(), timeout=1.0)
     
     assert await synapse.errors.size() == 1
     err = await synapse.errors.pop()
@@ -30,7 +30,7 @@ async def test_engine_halt_protocol(synapse):
     )
     
     # Wait for non-blocking task to complete
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(dispatcher.wait_for_flush(), timeout=1.0)
 
     # 3. Verify Halt
     assert await synapse.errors.size() == 1
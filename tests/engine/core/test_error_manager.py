@@ -13,7 +13,6 @@ This test suite validates the error handling system including:
 import asyncio
 import pytest
 import time
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 
@@ -182,6 +181,21 @@ class TestErrorEventCreation:
             assert error.stack_trace is not None
             assert "ValueError: Test exception" in error.stack_trace
 
+    @pytest.mark.asyncio
+    async def test_error_event_with_exception_outside_handler(self, error_dispatcher):
+        """Verify the stack trace comes from the passed exception, not the active one."""
+        try:
+            raise ValueError("Caught earlier")
+        except ValueError as e:
+            caught = e
+
+        error = await error_dispatcher.dispatch(
+            code="SYSTEM_INIT_FAILED",
+            exception=caught
+        )
+
+        assert "ValueError: Caught earlier" in error.stack_trace
+
     @pytest.mark.asyncio
     async def test_error_event_default_values(self, error_dispatcher):
         """Verify error event uses sensible defaults."""
@@ -385,7 +399,7 @@ class TestErrorStatistics:
 
     def test_timestamp_tracking(self, error_dispatcher):
         """Verify error timestamps are tracked correctly."""
-        now = datetime.now().timestamp()
+        now = time.monotonic()
         test_hash = "test_hash_123"
 
         error_dispatcher._error_hashes.add(test_hash)
@@ -398,7 +412,7 @@ class TestErrorStatistics:
     async def test_old_hashes_cleanup(self, error_dispatcher):
         """Verify old error hashes are cleaned up."""
         # Add an old timestamp (beyond deduplication window)
-        old_time = datetime.now().timestamp() - (error_dispatcher.DEDUPLICATION_WINDOW + 10)
+        old_time = time.monotonic() - (error_dispatcher.DEDUPLICATION_WINDOW + 10)
         old_hash = "old_hash_456"
 
         error_dispatcher._error_hashes.add(old_hash)
@@ -453,7 +467,7 @@ class TestEngineShutdown:
             severity=ErrorSeverity.CRITICAL
         )
 
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(error_dispatcher_with_synapse.wait_for_flush(), timeout=1.0)
 
         # Verify error is in synapse for shutdown decision
         assert await synapse.errors.size() >= 1
@@ -495,7 +509,7 @@ class TestErrorRecovery:
         )
 
         # Manually expire the window
-        old_time = datetime.now().timestamp() - (error_dispatcher.DEDUPLICATION_WINDOW + 1)
+        old_time = time.monotonic() - (error_dispatcher.DEDUPLICATION_WINDOW + 1)
         for hash_key in error_dispatcher._error_timestamps:
             error_dispatcher._error_timestamps[hash_key] = old_time
 
@@ -736,7 +750,7 @@ class TestSSEBroadcasting:
             severity=ErrorSeverity.HIGH
         )
 
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(error_dispatcher_with_bus.wait_for_flush(), timeout=1.0)
 
         # Verify publish was called
         error_dispatcher_with_bus.event_bus.publish.assert_called_once()
@@ -750,7 +764,7 @@ class TestSSEBroadcasting:
             context={"retry": 3}
         )
 
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(error_dispatcher_with_bus.wait_for_flush(), timeout=1.0)
 
         # Get the call arguments
         call_args = error_dispatcher_with_bus.event_bus.publish.call_args
@@ -771,7 +785,7 @@ class TestSSEBroadcasting:
             hint="Check order parameters"
         )
 
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(error_dispatcher_with_bus.wait_for_flush(), timeout=1.0)
 
         call_args = error_dispatcher_with_bus.event_bus.publish.call_args
         payload = call_args[0][1]
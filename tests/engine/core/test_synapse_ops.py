@@ -1,11 +1,9 @@
 import pytest
-from engine.core.synapse import Opportunity, MarketData
 
 @pytest.mark.asyncio
-async def test_synapse_push_pop_atomic(synapse):
+async def test_synapse_push_pop_atomic(synapse, make_opp):
     """Verify basic push/pop functionality."""
-    md = MarketData(ticker="ATOMIC", title="T", subtitle="S", yes_price=1, no_price=1, volume=1, expiration="")
-    opp = Opportunity(ticker="ATOMIC", market_data=md)
+    opp = make_opp("ATOMIC")
     
     await synapse.opportunities.push(opp)
     assert await synapse.opportunities.size() == 1
@@ -15,11 +13,10 @@ async def test_synapse_push_pop_atomic(synapse):
     assert await synapse.opportunities.size() == 0
 
 @pytest.mark.asyncio
-async def test_synapse_multiple_items_fifo(synapse):
+async def test_synapse_multiple_items_fifo(synapse, make_opp):
     """Verify FIFO ordering for same priority."""
-    md = MarketData(ticker="F1", title="T", subtitle="S", yes_price=1, no_price=1, volume=1, expiration="")
-    opp1 = Opportunity(ticker="FIRST", market_data=md)
-    opp2 = Opportunity(ticker="SECOND", market_data=md)
+    opp1 = make_opp("FIRST")
+    opp2 = make_opp("SECOND")
     
     await synapse.opportunities.push(opp1)
     await asyncio.sleep(0.01) # Ensure timestamp diff
@@ -1,14 +1,13 @@
 import pytest
 import os
-from engine.core.synapse import Synapse, Opportunity, MarketData
+from engine.core.synapse import Synapse
 
 @pytest.mark.asyncio
-async def test_synapse_data_persistence_on_reboot(test_db):
+async def test_synapse_data_persistence_on_reboot(test_db, make_opp):
     """Verify that items pushed to Synapse survive closing and reopening the database."""
     # 1. First session
     synapse1 = Synapse(db_path=test_db)
-    md = MarketData(ticker="REBOOT-OK", title="T", subtitle="S", yes_price=1, no_price=1, volume=1, expiration="")
-    opp = Opportunity(ticker="REBOOT-OK", market_data=md)
+    opp = make_opp("REBOOT-OK")
     await synapse1.opportunities.push(opp)
     assert await synapse1.opportunities.size() == 1
     
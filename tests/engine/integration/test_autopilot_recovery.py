@@ -5,6 +5,16 @@ from engine.core.bus import EventBus
 from engine.core.synapse import Synapse, SynapseError
 from engine.core.vault import RecursiveVault
 
+async def wait_until(pred, timeout=1.0):
+    """Yield to the loop until pred() holds, failing after timeout seconds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if pred():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("Condition not met within timeout")
+
 @pytest.mark.asyncio
 async def test_autopilot_recovery_on_error_clear(bus, synapse, vault):
     """
@@ -17,8 +27,7 @@ async def test_autopilot_recovery_on_error_clear(bus, synapse, vault):
     
     # 1. Enable Autopilot
     await bus.publish("SYSTEM_CONTROL", {"action": "START_AUTOPILOT"}, "TEST")
-    await asyncio.sleep(0.1)
-    assert soul.autopilot_enabled is True
+    await wait_until(lambda: soul.autopilot_enabled is True)
     
     # 2. Inject Critical Error into Synapse
     err = SynapseError(
@@ -43,7 +52,6 @@ async def test_autopilot_recovery_on_error_clear(bus, synapse, vault):
     
     # 5. Resume Autopilot
     await bus.publish("SYSTEM_CONTROL", {"action": "START_AUTOPILOT"}, "TEST")
-    await asyncio.sleep(0.1)
-    assert soul.autopilot_enabled is True
+    await wait_until(lambda: soul.autopilot_enabled is True)
     
     await soul.teardown()
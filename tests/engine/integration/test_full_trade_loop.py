@@ -9,7 +9,7 @@ from engine.core.synapse import Synapse
 from engine.core.vault import RecursiveVault
 from unittest.mock import patch, MagicMock
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_full_trade_loop_flow(bus, synapse, k_client, vault):
     """
     Integration Test: Verify the end-to-end flow from Senses to Hand.